@@ -0,0 +1,174 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from datetime import datetime, timezone
+
+from scheduling import ALGORITHMS, NameTable, Workload, run_algorithm
+
+# Default process counts and burst-time magnitudes to benchmark
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+BURST_SCALES = (10, 1_000, 1_000_000)
+
+
+# Synthetic workload generators
+# Each one takes the number of processes, the burst-time magnitude and a seed and returns a Workload
+# whose arrivals are in time order; the same arguments always give the same workload
+
+# Arrivals spread evenly over the time needed to run every process, bursts uniform in 1..burst_scale
+def uniform_workload(n, burst_scale, seed):
+    rng = random.Random(seed)
+    horizon = n * (burst_scale + 1) // 2
+    arrivals = sorted(rng.randint(0, horizon) for _ in range(n))
+    bursts = (rng.randint(1, burst_scale) for _ in range(n))
+    return _make_workload(n, bursts, arrivals, rng)
+
+
+# Poisson arrivals that come in bursts: exponential gaps between groups of 1..20 processes arriving together
+def bursty_workload(n, burst_scale, seed):
+    rng = random.Random(seed)
+    mean_gap = 10 * (burst_scale + 1) / 2
+    arrivals = array("q")
+    time = 0.0
+    while len(arrivals) < n:
+        time += rng.expovariate(1 / mean_gap)
+        arrivals.extend([int(time)] * min(rng.randint(1, 20), n - len(arrivals)))
+    bursts = (rng.randint(1, burst_scale) for _ in range(n))
+    return _make_workload(n, bursts, arrivals, rng)
+
+
+# Pareto-distributed bursts: mostly short jobs with a few very long ones, capped at 100 * burst_scale
+def heavy_tailed_workload(n, burst_scale, seed):
+    rng = random.Random(seed)
+    bursts = array("q", (min(int(rng.paretovariate(1.2) * burst_scale / 5) + 1, 100 * burst_scale) for _ in range(n)))
+    horizon = sum(bursts)
+    arrivals = sorted(rng.randint(0, horizon) for _ in range(n))
+    return _make_workload(n, bursts, arrivals, rng)
+
+
+# Busy groups of processes separated by long idle gaps, where the CPU has nothing to run
+def idle_gap_workload(n, burst_scale, seed):
+    rng = random.Random(seed)
+    arrivals = array("q")
+    time = 0
+    while len(arrivals) < n:
+        group = min(rng.randint(1, 50), n - len(arrivals))
+        arrivals.extend(time + rng.randint(0, burst_scale) for _ in range(group))
+        arrivals[-group:] = array("q", sorted(arrivals[-group:]))
+        time += group * burst_scale + rng.randint(100, 1000) * burst_scale  # Gap well past the end of the group
+    bursts = (rng.randint(1, burst_scale) for _ in range(n))
+    return _make_workload(n, bursts, arrivals, rng)
+
+
+def _make_workload(n, bursts, arrivals, rng):
+    names = NameTable(f"P{i}" for i in range(n))
+    priorities = array("q", (rng.randint(0, 9) for _ in range(n)))
+    return Workload(names, array("q", bursts), array("q", arrivals), priorities)
+
+
+WORKLOADS = {
+    "uniform": uniform_workload,
+    "bursty": bursty_workload,
+    "heavy_tailed": heavy_tailed_workload,
+    "idle_gaps": idle_gap_workload,
+}
+
+
+# Time one algorithm over a workload, best of repeat runs, and optionally measure its peak traced memory
+def measure(algorithm, workload, quantum, repeat=1, memory=True):
+    seconds = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result, _ = run_algorithm(algorithm, workload, quantum)
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+    segments = len(result.log_process)
+    del result
+
+    peak_bytes = None
+    if memory:
+        # A separate run, tracemalloc slows the scheduler down too much to time it at the same time
+        gc.collect()
+        tracemalloc.start()
+        run_algorithm(algorithm, workload, quantum)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return seconds, peak_bytes, segments
+
+
+# Round Robin quantum used for a burst-time magnitude, so the number of slices per process stays bounded
+def default_quantum(burst_scale):
+    return max(1, burst_scale // 10)
+
+
+def run_benchmarks(workloads, sizes, burst_scales, algorithms, seed=0, repeat=1, memory=True, quantum=None, progress=None):
+    results = []
+    for workload_name in workloads:
+        for burst_scale in burst_scales:
+            for n in sizes:
+                workload = WORKLOADS[workload_name](n, burst_scale, seed)
+                rr_quantum = quantum if quantum is not None else default_quantum(burst_scale)
+                for algorithm in algorithms:
+                    seconds, peak_bytes, segments = measure(algorithm, workload, rr_quantum, repeat, memory)
+                    row = {
+                        "workload": workload_name,
+                        "n": n,
+                        "burst_scale": burst_scale,
+                        "algorithm": algorithm,
+                        "quantum": rr_quantum if algorithm == "rr" else None,
+                        "seconds": seconds,
+                        "peak_bytes": peak_bytes,
+                        "segments": segments,
+                    }
+                    results.append(row)
+                    if progress is not None:
+                        progress(row)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling algorithms on synthetic workloads.")
+    parser.add_argument("-w", "--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS), help="workload generators (default: all)")
+    parser.add_argument("-n", "--sizes", nargs="+", type=int, default=list(SIZES), help="process counts (default: 10 to 10^6)")
+    parser.add_argument("-b", "--burst-scales", nargs="+", type=int, default=list(BURST_SCALES), help="burst-time magnitudes")
+    parser.add_argument("-a", "--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS), help="algorithms (default: all)")
+    parser.add_argument("-q", "--quantum", type=int, help="Round Robin quantum (default: a tenth of the burst-time magnitude)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the workload generators")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per case, the fastest is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory measurement")
+    parser.add_argument("-o", "--output", help="JSON file for the results (default: standard output)")
+    args = parser.parse_args(argv)
+
+    def progress(row):
+        print(f"{row['workload']:>12} n={row['n']:<8} burst={row['burst_scale']:<8} {row['algorithm']:<8} "
+              f"{row['seconds']:.4f}s", file=sys.stderr)
+
+    results = run_benchmarks(args.workloads, args.sizes, args.burst_scales, args.algorithms, args.seed,
+                             args.repeat, not args.no_memory, args.quantum, progress)
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
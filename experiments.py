@@ -0,0 +1,158 @@
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from benchmark import WORKLOADS
+from scheduling import ALGORITHMS, Workload, run_algorithm
+
+
+# Monte Carlo comparison of the algorithms over many random workloads
+# The workload columns are packed into one shared memory block that every worker maps once,
+# so a task is just a workload index and nothing but the per-workload averages is pickled
+
+# Pack the workloads' burst, arrival and priority columns into shared memory
+# Returns the block and the offsets of each workload's processes in it (workload k is offsets[k]:offsets[k + 1])
+def share_workloads(workloads):
+    offsets = array("q", [0])
+    for workload in workloads:
+        offsets.append(offsets[-1] + len(workload))
+    total = offsets[-1]
+
+    block = shared_memory.SharedMemory(create=True, size=max(3 * 8 * total, 1))
+    columns = block.buf.cast("q")
+    for k, workload in enumerate(workloads):
+        start, end = offsets[k], offsets[k + 1]
+        columns[start:end] = memoryview(workload.burst_times)
+        columns[total + start:total + end] = memoryview(workload.arrival_times)
+        columns[2 * total + start:2 * total + end] = memoryview(workload.priorities)
+    columns.release()
+    return block, offsets
+
+
+# Workload k as views over the shared columns, without copying
+def shared_workload(columns, offsets, k):
+    total = offsets[-1]
+    start, end = offsets[k], offsets[k + 1]
+    return Workload(range(end - start), columns[start:end], columns[total + start:total + end], columns[2 * total + start:2 * total + end])
+
+
+# Shared block and layout, attached once in each worker process
+_worker_state = None
+
+
+def _init_worker(block_name, offsets, algorithms, quantum):
+    global _worker_state
+    block = shared_memory.SharedMemory(name=block_name)
+    _worker_state = (block, block.buf.cast("q"), offsets, algorithms, quantum)
+
+
+# Average turnaround and waiting time of every algorithm on workload k
+def _run_workload(k):
+    _, columns, offsets, algorithms, quantum = _worker_state
+    return _averages(shared_workload(columns, offsets, k), algorithms, quantum)
+
+
+def _averages(workload, algorithms, quantum):
+    averages = []
+    for algorithm in algorithms:
+        result, (_, avg_turnaround, _, avg_waiting) = run_algorithm(algorithm, workload, quantum)
+        averages.append((avg_turnaround, avg_waiting))
+    return averages
+
+
+# Mean, spread and confidence interval of the mean of a list of values
+def summarize(values, confidence=0.95):
+    mean = statistics.fmean(values)
+    stdev = statistics.stdev(values) if len(values) > 1 else 0.0
+    margin = statistics.NormalDist().inv_cdf(0.5 + confidence / 2) * stdev / math.sqrt(len(values))
+    ordered = sorted(values)
+    return {
+        "mean": mean,
+        "stdev": stdev,
+        "ci_low": mean - margin,
+        "ci_high": mean + margin,
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "max": ordered[-1],
+    }
+
+
+# Run every algorithm on every workload, spread over worker processes, and summarize the
+# distributions of average turnaround and waiting time per algorithm
+def run_experiment(workloads, algorithms=ALGORITHMS, quantum=None, workers=None, confidence=0.95):
+    workers = workers or os.cpu_count() or 1
+    algorithms = tuple(algorithms)
+
+    if workers == 1:
+        averages = [_averages(workload, algorithms, quantum) for workload in workloads]
+    else:
+        block, offsets = share_workloads(workloads)
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(block.name, offsets, algorithms, quantum)) as executor:
+                chunksize = max(1, len(workloads) // (8 * workers))
+                averages = list(executor.map(_run_workload, range(len(workloads)), chunksize=chunksize))
+        finally:
+            block.close()
+            block.unlink()
+
+    summary = {}
+    for index, algorithm in enumerate(algorithms):
+        summary[algorithm] = {
+            "avg_turnaround": summarize([run[index][0] for run in averages], confidence),
+            "avg_waiting": summarize([run[index][1] for run in averages], confidence),
+        }
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the scheduling algorithms over many random workloads.")
+    parser.add_argument("-w", "--workload", choices=WORKLOADS, default="uniform", help="workload generator")
+    parser.add_argument("-k", "--count", type=int, default=1000, help="number of random workloads")
+    parser.add_argument("-n", "--processes", type=int, default=100, help="processes per workload")
+    parser.add_argument("-b", "--burst-scale", type=int, default=100, help="burst-time magnitude")
+    parser.add_argument("-a", "--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS), help="algorithms (default: all)")
+    parser.add_argument("-q", "--quantum", type=int, help="Round Robin quantum (default: a tenth of the burst-time magnitude)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first workload, the others use the following seeds")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+    parser.add_argument("--confidence", type=float, default=0.95, help="confidence level of the intervals")
+    parser.add_argument("-o", "--output", help="JSON file for the summary (default: standard output)")
+    args = parser.parse_args(argv)
+
+    quantum = args.quantum if args.quantum is not None else max(1, args.burst_scale // 10)
+    generate = WORKLOADS[args.workload]
+    workloads = [generate(args.processes, args.burst_scale, args.seed + k) for k in range(args.count)]
+
+    start = time.perf_counter()
+    summary = run_experiment(workloads, args.algorithms, quantum, args.workers, args.confidence)
+    elapsed = time.perf_counter() - start
+    report = {
+        "workload": args.workload,
+        "count": args.count,
+        "processes": args.processes,
+        "burst_scale": args.burst_scale,
+        "quantum": quantum,
+        "seed": args.seed,
+        "confidence": args.confidence,
+        "seconds": elapsed,
+        "summary": summary,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
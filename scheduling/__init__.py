@@ -0,0 +1,92 @@
+# Process scheduling simulator
+# The engine (workloads, algorithms, statistics, caching, run files) imports without tkinter, so batch jobs,
+# worker processes and display-less servers never load the GUI; GanttChart, ProcessTable and
+# create_simulation are loaded from scheduling.gui the first time they are used
+from .algorithms import (
+    ALGORITHM_TITLES,
+    ALGORITHMS,
+    PriorityPolicy,
+    RoundRobinPolicy,
+    SJNPolicy,
+    SRTPolicy,
+    SweepRow,
+    make_policy,
+    non_preemptive_priority,
+    non_preemptive_priority_stream,
+    profile_algorithm,
+    rerun_algorithm,
+    round_robin,
+    round_robin_stream,
+    round_robin_sweep,
+    run_algorithm,
+    sjn,
+    sjn_stream,
+    srt,
+    srt_stream,
+)
+from .cache import ResultCache
+from .engine import CHECKPOINT_INTERVAL, Checkpoint, Instrumentation, SchedulingPolicy, rerun_policy, run_policy, simulate
+from .model import NameTable, ScheduleResult, Workload
+from .multicore import MulticoreResult, multicore_schedule
+from .online import OnlinePriority, OnlineRoundRobin, OnlineScheduler, OnlineSJN, OnlineSRT
+from .runfile import RUN_FILE_EXTENSION, SavedRun, load_run, save_run
+from .stats import LogMetrics, StatsAccumulator, calc_stats, extended_stats
+
+__all__ = [
+    "ALGORITHM_TITLES",
+    "ALGORITHMS",
+    "CHECKPOINT_INTERVAL",
+    "Checkpoint",
+    "Instrumentation",
+    "LogMetrics",
+    "MulticoreResult",
+    "NameTable",
+    "OnlinePriority",
+    "OnlineRoundRobin",
+    "OnlineSJN",
+    "OnlineSRT",
+    "OnlineScheduler",
+    "PriorityPolicy",
+    "RUN_FILE_EXTENSION",
+    "ResultCache",
+    "RoundRobinPolicy",
+    "SJNPolicy",
+    "SRTPolicy",
+    "SavedRun",
+    "ScheduleResult",
+    "SchedulingPolicy",
+    "StatsAccumulator",
+    "SweepRow",
+    "Workload",
+    "calc_stats",
+    "extended_stats",
+    "load_run",
+    "make_policy",
+    "multicore_schedule",
+    "non_preemptive_priority",
+    "non_preemptive_priority_stream",
+    "profile_algorithm",
+    "rerun_algorithm",
+    "rerun_policy",
+    "round_robin",
+    "round_robin_stream",
+    "round_robin_sweep",
+    "run_algorithm",
+    "run_policy",
+    "save_run",
+    "simulate",
+    "sjn",
+    "sjn_stream",
+    "srt",
+    "srt_stream",
+]
+
+# Names served lazily from scheduling.gui
+_GUI_NAMES = ("GanttChart", "ProcessTable", "create_simulation")
+
+
+def __getattr__(name):
+    if name in _GUI_NAMES:
+        from . import gui
+        return getattr(gui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
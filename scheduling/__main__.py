@@ -0,0 +1,18 @@
+# python -m scheduling opens the GUI; with arguments it runs the headless runner instead,
+# e.g. python -m scheduling trace.csv -q 4 (see python -m scheduling --help)
+import sys
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        from .cli import main as cli_main
+        return cli_main(argv)
+
+    from .gui import create_simulation
+    create_simulation()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+# The four batch scheduling algorithms, as policies on the discrete-event core
+import heapq
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import Instrumentation, SchedulingPolicy, _arrival_order, rerun_policy, run_policy, simulate
+from .model import Workload
+from .stats import calc_stats
+
+
+# Function to simulate the Round Robin scheduling algorithm
+# Called as round_robin(workload, quantum) it returns a ScheduleResult, otherwise the list-based tuple
+# instrument is an optional Instrumentation filled in by the run
+def round_robin(processes, burst_times=None, arrival_times=None, quantum=None, instrument=None):
+    if isinstance(processes, Workload):
+        return _round_robin(processes, burst_times if quantum is None else quantum, instrument=instrument)
+    return _round_robin(Workload(processes, burst_times, arrival_times), quantum, instrument=instrument).as_tuple()
+
+
+# arrival_order can be passed in to share the sorting between runs over the same workload
+def _round_robin(workload, quantum, arrival_order=None, segment_sink=None, instrument=None):
+    return run_policy(workload, RoundRobinPolicy(workload, quantum), arrival_order, segment_sink, instrument)
+
+
+# Round Robin as a generator of (process id, start, end) segments, yielded as they are decided
+# on_complete(process id, completion time) is called as each process finishes
+def round_robin_stream(workload, quantum, on_complete=None, arrival_order=None, instrument=None):
+    return simulate(workload, RoundRobinPolicy(workload, quantum), on_complete, arrival_order, instrument)
+
+
+# FIFO queue of (index, remaining burst time); each process runs for at most one quantum at a time
+class RoundRobinPolicy(SchedulingPolicy):
+    every_process = True
+
+    def __init__(self, workload, quantum):
+        # A quantum below 1 would never advance the clock
+        if quantum is None or quantum < 1:
+            raise ValueError(f"Time quantum must be at least 1, got {quantum}.")
+        self.burst_times = workload.burst_times
+        self.quantum = quantum
+        self.ready = deque()
+
+    def admit(self, processes, time):
+        # Processes arriving together join the queue in process order
+        burst_times = self.burst_times
+        if len(processes) > 1:
+            processes = sorted(processes)
+        self.ready.extend((i, burst_times[i]) for i in processes)
+
+    def pop(self):
+        return self.ready.popleft()
+
+    def requeue(self, process, remaining, time):
+        self.ready.append((process, remaining))
+
+    def time_slice(self, remaining, time, next_arrival):
+        return min(remaining, self.quantum)
+
+
+# One row of a Round Robin quantum sweep; result is only kept when the logs are requested
+SweepRow = namedtuple("SweepRow", ["quantum", "avg_turnaround", "avg_waiting", "result"])
+
+
+# Run Round Robin over the same workload once per quantum and return one SweepRow per quantum,
+# in the order given. The arrival sorting is done once and shared by every run; with workers > 1
+# the quanta are spread over a process pool that receives the workload once per worker
+def round_robin_sweep(workload, quanta, workers=1, keep_logs=False):
+    quanta = list(quanta)
+    # Checked before any run starts, so a bad quantum fails here rather than in a pool worker
+    for quantum in quanta:
+        if quantum < 1:
+            raise ValueError(f"Time quantum must be at least 1, got {quantum}.")
+    arrival_order = _arrival_order(workload)
+
+    if workers <= 1 or len(quanta) < 2:
+        return [_sweep_quantum(workload, arrival_order, quantum, keep_logs) for quantum in quanta]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker, initargs=(workload, arrival_order)) as executor:
+        chunksize = max(1, len(quanta) // (4 * workers))
+        return list(executor.map(_sweep_worker, quanta, [keep_logs] * len(quanta), chunksize=chunksize))
+
+
+def _sweep_quantum(workload, arrival_order, quantum, keep_logs):
+    result = _round_robin(workload, quantum, arrival_order)
+    _, avg_turnaround, _, avg_waiting = calc_stats(result)
+    return SweepRow(quantum, avg_turnaround, avg_waiting, result if keep_logs else None)
+
+
+# Workload and arrival order of the sweep, set once in each worker process
+_sweep_state = None
+
+
+def _init_sweep_worker(workload, arrival_order):
+    global _sweep_state
+    _sweep_state = (workload, arrival_order)
+
+
+def _sweep_worker(quantum, keep_logs):
+    workload, arrival_order = _sweep_state
+    return _sweep_quantum(workload, arrival_order, quantum, keep_logs)
+
+
+# Function to simulate the SJN scheduling algorithm
+# Called as sjn(workload) it returns a ScheduleResult, otherwise the list-based tuple
+def sjn(processes, burst_times=None, arrival_times=None, instrument=None):
+    if isinstance(processes, Workload):
+        return _sjn(processes, instrument=instrument)
+    return _sjn(Workload(processes, burst_times, arrival_times), instrument=instrument).as_tuple()
+
+
+def _sjn(workload, segment_sink=None, instrument=None):
+    return run_policy(workload, SJNPolicy(workload), segment_sink=segment_sink, instrument=instrument)
+
+
+# SJN as a generator of (process id, start, end) segments, yielded as they are decided
+# on_complete(process id, completion time) is called as each process finishes
+def sjn_stream(workload, on_complete=None, instrument=None):
+    return simulate(workload, SJNPolicy(workload), on_complete, instrument=instrument)
+
+
+# Min-heap of (burst time, time admitted, index): the shortest job runs to completion,
+# equal bursts run in the order they were admitted, then in process order
+class SJNPolicy(SchedulingPolicy):
+    def __init__(self, workload):
+        self.burst_times = workload.burst_times
+        self.ready = []
+
+    def admit(self, processes, time):
+        burst_times = self.burst_times
+        for i in processes:
+            heapq.heappush(self.ready, (burst_times[i], time, i))
+
+    def pop(self):
+        burst, _, i = heapq.heappop(self.ready)
+        return i, burst
+
+
+# Function to simulate the SRT scheduling algorithm
+# Event driven: the clock jumps straight to the next arrival or completion instead of
+# stepping one time unit at a time, so the cost grows with the number of events
+# Called as srt(workload) it returns a ScheduleResult, otherwise the list-based tuple
+def srt(processes, burst_times=None, arrival_times=None, instrument=None):
+    if isinstance(processes, Workload):
+        return _srt(processes, instrument=instrument)
+    return _srt(Workload(processes, burst_times, arrival_times), instrument=instrument).as_tuple()
+
+
+def _srt(workload, segment_sink=None, instrument=None):
+    return run_policy(workload, SRTPolicy(workload), segment_sink=segment_sink, instrument=instrument)
+
+
+# SRT as a generator of (process id, start, end) segments, yielded as they are decided
+# on_complete(process id, completion time) is called as each process finishes
+def srt_stream(workload, on_complete=None, instrument=None):
+    return simulate(workload, SRTPolicy(workload), on_complete, instrument=instrument)
+
+
+# Min-heap of (remaining burst time, index); the running process is preempted at every arrival
+# and goes back to the heap, so a shorter arrival takes over (ties go to the lowest index)
+class SRTPolicy(SchedulingPolicy):
+    merge_segments = True
+
+    def __init__(self, workload):
+        self.burst_times = workload.burst_times
+        self.ready = []
+
+    def admit(self, processes, time):
+        burst_times = self.burst_times
+        for i in processes:
+            heapq.heappush(self.ready, (burst_times[i], i))
+
+    def pop(self):
+        remaining, i = heapq.heappop(self.ready)
+        return i, remaining
+
+    def requeue(self, process, remaining, time):
+        heapq.heappush(self.ready, (remaining, process))
+
+    def time_slice(self, remaining, time, next_arrival):
+        # Run until the process completes or the next process arrives, whichever comes first
+        if next_arrival is None:
+            return remaining
+        return min(remaining, next_arrival - time)
+
+
+# Non-Preemptive Priority Scheduling Function
+# Called as non_preemptive_priority(workload) it returns a ScheduleResult, otherwise the list-based tuple
+def non_preemptive_priority(processes, burst_times=None, arrival_times=None, priorities=None, instrument=None):
+    if isinstance(processes, Workload):
+        return _non_preemptive_priority(processes, instrument=instrument)
+    return _non_preemptive_priority(Workload(processes, burst_times, arrival_times, priorities), instrument=instrument).as_tuple()
+
+
+def _non_preemptive_priority(workload, segment_sink=None, instrument=None):
+    return run_policy(workload, PriorityPolicy(workload), segment_sink=segment_sink, instrument=instrument)
+
+
+# Non-preemptive priority as a generator of (process id, start, end) segments, yielded as they are decided
+# on_complete(process id, completion time) is called as each process finishes
+def non_preemptive_priority_stream(workload, on_complete=None, instrument=None):
+    return simulate(workload, PriorityPolicy(workload), on_complete, instrument=instrument)
+
+
+# Min-heap of (priority, index): the highest priority process that has arrived runs to completion
+# (ties go to the lowest index); processes with no burst time are still dispatched, as zero-length segments
+class PriorityPolicy(SchedulingPolicy):
+    runs_empty_jobs = True
+    every_process = True
+
+    def __init__(self, workload):
+        self.burst_times = workload.burst_times
+        self.priorities = workload.priorities
+        self.ready = []
+
+    def admit(self, processes, time):
+        priorities = self.priorities
+        for i in processes:
+            heapq.heappush(self.ready, (priorities[i], i))
+
+    def pop(self):
+        i = heapq.heappop(self.ready)[1]
+        return i, self.burst_times[i]
+
+
+# Algorithms by short name, in the order the results are displayed
+ALGORITHMS = ("rr", "sjn", "srt", "priority")
+# Display names of the algorithms
+ALGORITHM_TITLES = {
+    "rr": "Round Robin",
+    "sjn": "Shortest Job Next (SJN)",
+    "srt": "Shortest Remaining Time (SRT)",
+    "priority": "Non-Preemptive Priority",
+}
+
+
+# Run one algorithm over a workload and return its ScheduleResult and calc_stats tuple
+# Module level so it can be sent to a worker process
+# With a segment_sink(process id, start, end) the execution log is streamed there instead of kept in the result
+# With an Instrumentation as instrument, the run's counters and timings are recorded in it
+# With checkpoints set, the result keeps checkpoints so rerun_algorithm can update it after an edit
+def run_algorithm(algorithm, workload, quantum=None, segment_sink=None, instrument=None, checkpoints=False):
+    if instrument is not None:
+        instrument.algorithm = algorithm
+    result = run_policy(workload, make_policy(algorithm, workload, quantum), segment_sink=segment_sink,
+                        instrument=instrument, checkpoints=checkpoints)
+    return result, calc_stats(result)
+
+
+# Policy of an algorithm by short name, for running it on the discrete-event core
+def make_policy(algorithm, workload, quantum=None):
+    if algorithm == "rr":
+        return RoundRobinPolicy(workload, quantum)
+    elif algorithm == "sjn":
+        return SJNPolicy(workload)
+    elif algorithm == "srt":
+        return SRTPolicy(workload)
+    elif algorithm == "priority":
+        return PriorityPolicy(workload)
+    raise ValueError(f"Unknown algorithm: {algorithm}")
+
+
+# What-if re-run: run_algorithm on workload, an edited copy of previous_workload, reusing previous,
+# the checkpointed result of the same algorithm (and quantum) on previous_workload. Only the schedule
+# from the last checkpoint before the first edited arrival is simulated again, so editing one process
+# costs about the part of the run after it. changed lists the edited process ids; when it is not
+# given the workloads are compared to find them. Returns the new checkpointed result and its stats
+def rerun_algorithm(algorithm, previous_workload, previous, workload, changed=None, quantum=None):
+    policy = make_policy(algorithm, workload, quantum)
+    if previous.checkpoints is None or len(previous_workload) != len(workload):
+        result = run_policy(workload, policy, checkpoints=True)
+        return result, calc_stats(result)
+
+    if changed is None:
+        columns = [(previous_workload.arrival_times, workload.arrival_times), (previous_workload.burst_times, workload.burst_times)]
+        if algorithm == "priority":
+            columns.append((previous_workload.priorities, workload.priorities))
+        changed = sorted({i for old, new in columns if old != new for i in range(len(workload)) if old[i] != new[i]})
+    earliest = min((min(previous_workload.arrival_times[i], workload.arrival_times[i]) for i in changed), default=float("inf"))
+
+    result = rerun_policy(workload, policy, previous, changed, earliest)
+    return result, calc_stats(result)
+
+
+# run_algorithm with instrumentation, returning the instrumentation report as a third item
+# Module level so the GUI can send profiled runs to its worker processes
+def profile_algorithm(algorithm, workload, quantum=None):
+    instrument = Instrumentation()
+    result, result_stats = run_algorithm(algorithm, workload, quantum, instrument=instrument)
+    return result, result_stats, instrument.report()
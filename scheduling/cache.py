@@ -0,0 +1,94 @@
+# Memoized simulation results, in memory and on disk
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+from .algorithms import run_algorithm
+
+# Version of the cached results, part of every key: bump it whenever a scheduler's output or the
+# result format changes, so results cached by older code (e.g. in a --cache-dir) are not served again
+CACHE_VERSION = 1
+
+# Memoized run_algorithm results, keyed by a fingerprint of the algorithm and its inputs
+# Keeps the maxsize most recently used results in memory and, when a directory is given,
+# every result on disk too, so repeated runs and later batch jobs skip the simulation
+class ResultCache:
+    def __init__(self, maxsize=32, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.entries = OrderedDict()  # key -> (result, stats), least recently used first
+        self.hits = 0  # Lookups answered from memory
+        self.disk_hits = 0  # Lookups answered from the directory
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    # Fingerprint of a run and the cache version; the quantum only counts for Round Robin and the priorities for priority scheduling
+    @staticmethod
+    def key(algorithm, workload, quantum=None):
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_VERSION}\0{algorithm}\0{quantum if algorithm == 'rr' else ''}\0{len(workload)}\0".encode())
+        for name in workload.names:
+            digest.update(str(name).encode() + b"\0")
+        digest.update(workload.burst_times.tobytes())
+        digest.update(workload.arrival_times.tobytes())
+        if algorithm == "priority":
+            digest.update(workload.priorities.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        if self.directory is not None:
+            try:
+                with open(self.path(key), "rb") as f:
+                    entry = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError, ImportError, AttributeError):
+                # Unreadable, or written by a version of the code whose classes have since moved
+                entry = None
+            if entry is not None:
+                self.disk_hits += 1
+                self.remember(key, entry)
+                return entry
+
+        self.misses += 1
+        return None
+
+    def put(self, key, entry):
+        self.remember(key, entry)
+        if self.directory is not None:
+            # Write to a temporary file first so a concurrent reader never sees half a result
+            temporary = f"{self.path(key)}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.path(key))
+
+    def remember(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    # run_algorithm through the cache
+    def run(self, algorithm, workload, quantum=None):
+        key = self.key(algorithm, workload, quantum)
+        entry = self.get(key)
+        if entry is None:
+            entry = run_algorithm(algorithm, workload, quantum)
+            self.put(key, entry)
+        return entry
+
+    def info(self):
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses, "size": len(self.entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        # Forget the results kept in memory; the directory is left alone
+        self.entries.clear()
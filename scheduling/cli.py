@@ -0,0 +1,220 @@
+# Headless runner: simulate a process trace (or replay a saved run) and write the results to files
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+from array import array
+
+from .algorithms import ALGORITHMS, run_algorithm
+from .cache import ResultCache
+from .engine import Instrumentation
+from .model import NameTable, Workload
+from .runfile import RUN_FILE_EXTENSION, load_run, save_run
+from .stats import LogMetrics, calc_stats, extended_stats
+
+# Number of trace rows parsed into the columns at a time
+CHUNK_ROWS = 1 << 16
+# Buffer size for trace and output files, in bytes
+BUFFER_SIZE = 1 << 20
+
+# Accepted names of each trace column; priority is optional and defaults to 0
+TRACE_COLUMNS = {
+    "name": ("name", "process"),
+    "arrival": ("arrival", "arrival_time"),
+    "burst": ("burst", "burst_time"),
+    "priority": ("priority",),
+}
+
+
+# Read a process trace from a CSV file (with a header row) or a JSONL file into a Workload
+# Rows are parsed chunk by chunk straight into int64 columns and a packed name table,
+# so no Python object is kept per row; processes without a name are called P<index>
+def read_trace(path, trace_format=None, chunk_rows=CHUNK_ROWS):
+    if trace_format is None:
+        trace_format = "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+    names = NameTable()
+    arrival_times = array("q")
+    burst_times = array("q")
+    priorities = array("q")
+
+    with open(path, newline="", encoding="utf-8", buffering=BUFFER_SIZE) as f:
+        records = _csv_records(f) if trace_format == "csv" else _jsonl_records(f)
+        while True:
+            chunk = list(itertools.islice(records, chunk_rows))
+            if not chunk:
+                break
+            first = len(names)
+            try:
+                names.extend(str(name) if name else f"P{first + i}" for i, (name, _, _, _) in enumerate(chunk))
+                arrival_times.extend(int(arrival) for _, arrival, _, _ in chunk)
+                burst_times.extend(int(burst) for _, _, burst, _ in chunk)
+                priorities.extend(int(priority or 0) for _, _, _, priority in chunk)
+            except (TypeError, ValueError):
+                raise ValueError(f"{path}: invalid number in rows {first + 1}-{first + len(chunk)}") from None
+
+    if not len(names):
+        raise ValueError(f"{path}: trace has no processes")
+    return Workload(names, burst_times, arrival_times, priorities)
+
+
+# Find the position of each trace column in a header, None for a missing optional column
+def _column_positions(header, path=""):
+    header = [column.strip().lower() for column in header]
+    positions = []
+    for column, aliases in TRACE_COLUMNS.items():
+        position = next((header.index(alias) for alias in aliases if alias in header), None)
+        if position is None and column in ("arrival", "burst"):
+            raise ValueError(f"{path}: missing '{column}' column")
+        positions.append(position)
+    return positions
+
+
+# (name, arrival, burst, priority) records from a CSV trace
+def _csv_records(f):
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    positions = _column_positions(header, f.name)
+    for row in reader:
+        if row:
+            yield tuple(row[position] if position is not None and position < len(row) else None for position in positions)
+
+
+# (name, arrival, burst, priority) records from a JSONL trace, one JSON object per line
+def _jsonl_records(f):
+    keys = None
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{f.name}: line {line_number}: invalid JSON ({e.msg})") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"{f.name}: line {line_number}: not a JSON object")
+        if keys is None:
+            keys = [next((alias for alias in aliases if alias in record), aliases[0]) for aliases in TRACE_COLUMNS.values()]
+        yield tuple(record.get(key) for key in keys)
+
+
+# Run one algorithm, streaming its execution log to <algorithm>_log.csv (unless write_log is off)
+# and writing the per-process table to <algorithm>_processes.csv
+# The counts the extended statistics need from the log are gathered from the segments as they go past,
+# so a streamed run keeps neither its log nor a copy of it, whether the log is written or not
+# With a ResultCache the whole result is kept (and looked up) there, and the log is written from it;
+# an Instrumentation as instrument profiles the run, which then always simulates instead of using the cache
+# With save set the whole result is also kept, and saved to <algorithm>.schedrun
+# Given a result (e.g. a saved run), nothing is simulated and the files are written from it
+# Returns the calc_stats tuple, the segment count and the extended_stats dict
+def run_to_files(algorithm, workload, quantum, output_dir, write_log=True, cache=None, instrument=None, save=False, result=None):
+    names = workload.names
+    log_metrics = LogMetrics(len(workload))
+    segments = 0
+
+    with open(os.path.join(output_dir, f"{algorithm}_log.csv") if write_log else os.devnull, "w", newline="", buffering=BUFFER_SIZE) as log_file:
+        log_writer = csv.writer(log_file)
+        log_writer.writerow(("process", "start", "end"))
+
+        def write_segment(process, start, end):
+            nonlocal segments
+            segments += 1
+            log_metrics(process, start, end)
+            if write_log:
+                log_writer.writerow((names[process], start, end))
+
+        if result is not None or save or (cache is not None and instrument is None):
+            if result is not None:
+                result_stats = calc_stats(result)
+            elif cache is not None and instrument is None:
+                result, result_stats = cache.run(algorithm, workload, quantum)
+            else:
+                result, result_stats = run_algorithm(algorithm, workload, quantum, instrument=instrument)
+            for segment in zip(result.log_process, result.log_start, result.log_end):
+                write_segment(*segment)
+        else:
+            result, result_stats = run_algorithm(algorithm, workload, quantum, segment_sink=write_segment, instrument=instrument)
+
+    if save:
+        save_run(os.path.join(output_dir, algorithm + RUN_FILE_EXTENSION), algorithm, workload, result)
+
+    with open(os.path.join(output_dir, f"{algorithm}_processes.csv"), "w", newline="", buffering=BUFFER_SIZE) as table_file:
+        table_writer = csv.writer(table_file)
+        table_writer.writerow(("process", "arrival", "burst", "priority", "completion", "turnaround", "waiting"))
+        table_writer.writerows(
+            (names[i], workload.arrival_times[i], workload.burst_times[i], workload.priorities[i],
+             result.completion_times[i], result.turnaround_times[i], result.waiting_times[i])
+            for i in range(len(workload))
+        )
+
+    return result_stats, segments, extended_stats(workload, result, log_metrics)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the scheduling simulations on a process trace without the GUI.")
+    parser.add_argument("trace", help="CSV (with a header row) or JSONL file with name, arrival, burst and priority, "
+                                      f"or a {RUN_FILE_EXTENSION} file saved by --save-runs to replay without simulating")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="trace format, by default taken from the file extension")
+    parser.add_argument("-a", "--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS), help="algorithms to run (default: all)")
+    parser.add_argument("-q", "--quantum", type=int, help="time quantum for Round Robin")
+    parser.add_argument("-o", "--output-dir", default=".", help="directory for the result files (default: current directory)")
+    parser.add_argument("--no-log", action="store_true", help="do not write the execution logs")
+    parser.add_argument("--cache-dir", help="directory of cached results, reused by later runs on the same trace")
+    parser.add_argument("--profile", action="store_true", help="instrument the runs and write their counters and timings to profile.json")
+    parser.add_argument("--save-runs", action="store_true", help=f"also save each run as <algorithm>{RUN_FILE_EXTENSION}, for replaying later")
+    args = parser.parse_args(argv)
+
+    # A saved run is replayed as it is: its algorithm replaces --algorithms and nothing is simulated
+    replay = args.trace.endswith(RUN_FILE_EXTENSION)
+    if not replay and "rr" in args.algorithms and (args.quantum is None or args.quantum <= 0):
+        parser.error("a positive --quantum is needed to run rr")
+
+    try:
+        if replay:
+            saved = load_run(args.trace)
+            workload, algorithms = saved.workload, [saved.algorithm]
+        else:
+            workload, algorithms = read_trace(args.trace, args.format), args.algorithms
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    cache = ResultCache(directory=args.cache_dir) if args.cache_dir else None
+    stats = {}
+    profiles = {}
+    for algorithm in algorithms:
+        instrument = Instrumentation() if args.profile and not replay else None
+        (total_turnaround, avg_turnaround, total_waiting, avg_waiting), segments, metrics = run_to_files(
+            algorithm, workload, args.quantum, args.output_dir, write_log=not args.no_log, cache=cache, instrument=instrument,
+            save=args.save_runs and not replay, result=saved.result if replay else None)
+        if instrument is not None:
+            profiles[algorithm] = instrument.report()
+        stats[algorithm] = {
+            "processes": len(workload),
+            "segments": segments,
+            "total_turnaround": total_turnaround,
+            "avg_turnaround": avg_turnaround,
+            "total_waiting": total_waiting,
+            "avg_waiting": avg_waiting,
+            **metrics,
+        }
+        print(f"{algorithm}: average turnaround {avg_turnaround:.2f}, average waiting {avg_waiting:.2f}, "
+              f"average response {metrics['avg_response']:.2f}, p95 waiting {metrics['p95_waiting']:.2f}, "
+              f"CPU utilization {metrics['cpu_utilization']:.1%}, context switches {metrics['context_switches']}")
+
+    with open(os.path.join(args.output_dir, "stats.json"), "w") as f:
+        json.dump(stats, f, indent=2)
+    if args.profile:
+        with open(os.path.join(args.output_dir, "profile.json"), "w") as f:
+            json.dump(profiles, f, indent=2)
+    if cache is not None:
+        print(f"cache: {cache.disk_hits} hits, {cache.misses} misses")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
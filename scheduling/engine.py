@@ -0,0 +1,349 @@
+# Discrete-event core the batch schedulers run on, and its instrumentation
+import bisect
+import json
+from array import array
+from collections import namedtuple
+from time import perf_counter
+
+from .model import ScheduleResult, _zeros
+
+
+# Process ids sorted by arrival time (ties in process order)
+# Processes with no burst time never run, so they are left out unless keep_empty is set
+def _arrival_order(workload, keep_empty=False):
+    n = len(workload)
+    burst_times = workload.burst_times
+    arrival_times = workload.arrival_times
+    ids = range(n) if keep_empty else (i for i in range(n) if burst_times[i] > 0)
+    # Traces are usually recorded in arrival order already, so avoid the sort when they are
+    if all(arrival_times[i] <= arrival_times[i + 1] for i in range(n - 1)):
+        return array("q", ids)
+    return array("q", sorted(ids, key=arrival_times.__getitem__))
+
+
+# Run a scheduler stream to the end and gather its segments into a ScheduleResult
+# completion_times is filled in by the stream's on_complete callback; processes with no burst time
+# get turnaround and waiting times only when every_process is set, otherwise they stay 0
+# With a segment_sink(process id, start, end) the segments go there instead of the result's log
+def _collect(workload, stream, completion_times, every_process, segment_sink=None):
+    log_process, log_start, log_end = array("q"), array("q"), array("q")  # Log to store the execution order and time intervals
+
+    if segment_sink is not None:
+        for process, start, end in stream:
+            segment_sink(process, start, end)
+    else:
+        for process, start, end in stream:
+            log_process.append(process)
+            log_start.append(start)
+            log_end.append(end)
+
+    turnaround_times, waiting_times = _turnaround_and_waiting(workload, completion_times, every_process)
+    return ScheduleResult(workload.names, completion_times, turnaround_times, waiting_times, log_process, log_start, log_end)
+
+
+# Turnaround and waiting time columns from the completion times
+# Processes with no burst time get them only when every_process is set, otherwise they stay 0
+def _turnaround_and_waiting(workload, completion_times, every_process):
+    n = len(workload)
+    burst_times = workload.burst_times
+    arrival_times = workload.arrival_times
+    turnaround_times = array("q", (completion_times[i] - arrival_times[i] if every_process or burst_times[i] > 0 else 0 for i in range(n)))
+    waiting_times = array("q", (turnaround_times[i] - burst_times[i] if every_process or burst_times[i] > 0 else 0 for i in range(n)))
+    return turnaround_times, waiting_times
+
+
+# Counters and timings of one scheduler run, for finding where the time of a slow run goes
+# Pass one as instrument= to a scheduler, a scheduler stream or run_algorithm; it is filled in while the run
+# goes on and report() (or to_json()) gives the numbers once it is over. callback(report) is called at the end.
+# The run is timed from the first segment asked of the stream to the last, so a stream that is not
+# consumed to the end is never finished
+# Without an instrument the schedulers skip all of this, so plain runs pay only a None check per event
+class Instrumentation:
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.algorithm = None  # Set by run_algorithm, for the report
+        self._reset(0)
+        self.started = None
+
+    # Starting a run zeroes the counters, so an instrument used for several runs reports each on its own
+    def start(self, processes):
+        self._reset(processes)
+        self.started = perf_counter()
+
+    def _reset(self, processes):
+        self.processes = processes
+        self.decisions = 0  # Picks of the next process to run
+        self.context_switches = 0  # Picks of a different process than the one that ran last
+        self.queue_ops = 0  # Pushes to and pops from the ready queue
+        self.idle_jumps = 0  # Idle stretches fast-forwarded in one step each
+        self.idle_ticks_skipped = 0  # Idle time units covered by those jumps instead of being stepped
+        self.peak_ready = 0  # Longest the ready queue got
+        self.wall_time = 0.0  # Seconds from the start to the end of the run
+        self.last_process = None
+
+    def finish(self):
+        self.wall_time = perf_counter() - self.started
+        if self.callback is not None:
+            self.callback(self.report())
+
+    # ready_length is the length of the ready queue after the change
+    def queued(self, count, ready_length):
+        self.queue_ops += count
+        if ready_length > self.peak_ready:
+            self.peak_ready = ready_length
+
+    def dispatched(self, process):
+        self.decisions += 1
+        self.queue_ops += 1
+        if process != self.last_process:
+            if self.last_process is not None:
+                self.context_switches += 1
+            self.last_process = process
+
+    def idle(self, ticks):
+        self.idle_jumps += 1
+        self.idle_ticks_skipped += ticks
+
+    def report(self):
+        return {
+            "algorithm": self.algorithm,
+            "processes": self.processes,
+            "decisions": self.decisions,
+            "context_switches": self.context_switches,
+            "queue_ops": self.queue_ops,
+            "idle_jumps": self.idle_jumps,
+            "idle_ticks_skipped": self.idle_ticks_skipped,
+            "peak_ready": self.peak_ready,
+            "wall_time": self.wall_time,
+        }
+
+    def to_json(self, **options):
+        return json.dumps(self.report(), **options)
+
+
+# Discrete-event core shared by the batch schedulers
+# It owns everything the policies have in common: the arrival cursor, idle fast-forward, the execution log,
+# completion callbacks and instrumentation. A policy (a SchedulingPolicy subclass) only brings its ready
+# queue and its preemption rule, so a new one, e.g. preemptive priority or MLFQ, just subclasses it
+# The policy keeps its ready queue in self.ready (any container whose length is the number of ready processes)
+class SchedulingPolicy:
+    runs_empty_jobs = False  # Whether processes with no burst time are dispatched (as zero-length segments)
+    every_process = False  # Whether processes with no burst time still get turnaround and waiting times
+    merge_segments = False  # Whether back-to-back runs of the same process are logged as one segment
+    ready = ()
+
+    # Add processes that arrived by time; processes is an array of ids in arrival order
+    def admit(self, processes, time):
+        raise NotImplementedError
+
+    # Remove and return the (process id, remaining burst time) to run next
+    def pop(self):
+        raise NotImplementedError
+
+    # Put back a process that was preempted with burst time left; called after the arrivals up to time
+    def requeue(self, process, remaining, time):
+        raise NotImplementedError
+
+    # Preemption rule: how long the dispatched process runs before the scheduler decides again,
+    # given the time of the next arrival (None when there is none); by default it runs to completion
+    def time_slice(self, remaining, time, next_arrival):
+        return remaining
+
+    # Copy of the ready queue for a checkpoint, and back; policies with more state than self.ready extend these
+    def save_state(self):
+        return self.ready.copy()
+
+    def load_state(self, state):
+        self.ready = state.copy()
+
+
+# The policy's time_slice, or None for a non-preemptive policy, which runs every process to completion without asking
+def _time_slice(policy):
+    return policy.time_slice if type(policy).time_slice is not SchedulingPolicy.time_slice else None
+
+
+# State of a run at the top of the event loop, before the arrivals at time are admitted
+# next_arrival is the arrival cursor, segments the number of segments emitted so far and ready the policy's saved state;
+# preempted, last_process and last_start are the loop's pending requeue and merged segment
+Checkpoint = namedtuple("Checkpoint", ["time", "next_arrival", "segments", "preempted", "last_process", "last_start", "ready"])
+
+# Minimum number of events between checkpoints; a checkpoint is also put off until there have been at least
+# as many events as there are ready processes to copy, so checkpointing costs O(1) per event
+CHECKPOINT_INTERVAL = 1024
+
+
+# Run a policy as a generator of (process id, start, end) segments, yielded as they are decided
+# on_complete(process id, completion time) is called as each process finishes
+# Given a list as checkpoints, a Checkpoint is appended to it every CHECKPOINT_INTERVAL events or so;
+# given a Checkpoint as resume, the run carries on from it (arrival_order must then be the run's order)
+# An instrument is started when the stream is first advanced and finished once it is exhausted
+def simulate(workload, policy, on_complete=None, arrival_order=None, instrument=None, checkpoints=None, resume=None):
+    if instrument is not None:
+        instrument.start(len(workload))
+    arrival_times = workload.arrival_times
+    admit, pop, requeue = policy.admit, policy.pop, policy.requeue
+    time_slice = _time_slice(policy)
+    merge_segments = policy.merge_segments
+    time = 0  # Current time in the simulation
+
+    # Processes sorted by arrival time, with a cursor to the next one to arrive
+    if arrival_order is None:
+        arrival_order = _arrival_order(workload, keep_empty=policy.runs_empty_jobs)
+    arrivals = len(arrival_order)
+    next_arrival = 0
+
+    preempted = None  # (process id, remaining burst time) to requeue once the arrivals are in
+    last_process = None  # Process of the segment being merged, with merge_segments
+    last_start = 0
+    segments = 0  # Segments emitted so far
+    events = 0  # Events since the last checkpoint
+
+    if resume is not None:
+        time, next_arrival, segments, preempted, last_process, last_start, state = resume
+        policy.load_state(state)
+    ready = policy.ready
+
+    while True:
+        if checkpoints is not None:
+            if events >= CHECKPOINT_INTERVAL and events >= len(ready):
+                checkpoints.append(Checkpoint(time, next_arrival, segments, preempted, last_process, last_start, policy.save_state()))
+                events = 0
+            events += 1
+
+        # Admit the processes that have arrived by now, as one batch
+        if next_arrival < arrivals and arrival_times[arrival_order[next_arrival]] <= time:
+            first = next_arrival
+            next_arrival += 1
+            while next_arrival < arrivals and arrival_times[arrival_order[next_arrival]] <= time:
+                next_arrival += 1
+            admit(arrival_order[first:next_arrival], time)
+            if instrument is not None:
+                instrument.queued(next_arrival - first, len(ready))
+
+        # A preempted process goes back behind the processes that arrived while it ran
+        if preempted is not None:
+            requeue(preempted[0], preempted[1], time)
+            preempted = None
+            if instrument is not None:
+                instrument.queued(1, len(ready))
+
+        if not ready:
+            # Stop if all processes are completed
+            if next_arrival == arrivals:
+                break
+            # If nothing is ready to run, jump to the next arrival
+            if instrument is not None:
+                instrument.idle(arrival_times[arrival_order[next_arrival]] - time)
+            time = arrival_times[arrival_order[next_arrival]]
+            continue
+
+        current, remaining = pop()
+        if instrument is not None:
+            instrument.dispatched(current)
+
+        # A merged segment lasts until a different process is dispatched
+        if merge_segments and current != last_process:
+            if last_process is not None:
+                segments += 1
+                yield last_process, last_start, time
+            last_process, last_start = current, time
+
+        # Run the process for as long as the policy lets it
+        start = time
+        if time_slice is None:
+            time += remaining
+            remaining = 0
+        else:
+            run_time = time_slice(remaining, time, arrival_times[arrival_order[next_arrival]] if next_arrival < arrivals else None)
+            time += run_time
+            remaining -= run_time
+
+        if remaining > 0:
+            preempted = (current, remaining)
+        elif on_complete is not None:
+            on_complete(current, time)
+
+        if not merge_segments:
+            segments += 1
+            yield current, start, time
+
+    # After the loop, emit the last merged segment
+    if last_process is not None:
+        yield last_process, last_start, time
+    if instrument is not None:
+        instrument.finish()
+
+
+# Run a policy to the end and return its ScheduleResult, with turnaround and waiting times filled in
+# With checkpoints set, the result keeps the run's checkpoints and arrival order for rerun_policy
+def run_policy(workload, policy, arrival_order=None, segment_sink=None, instrument=None, checkpoints=False):
+    completion_times = _zeros(len(workload))
+    if checkpoints:
+        checkpoints = []
+        if arrival_order is None:
+            arrival_order = _arrival_order(workload, keep_empty=policy.runs_empty_jobs)
+    else:
+        checkpoints = None
+    stream = simulate(workload, policy, completion_times.__setitem__, arrival_order, instrument, checkpoints)
+    result = _collect(workload, stream, completion_times, policy.every_process, segment_sink)
+    if checkpoints is not None:
+        result.checkpoints = checkpoints
+        result.arrival_order = arrival_order
+    return result
+
+
+# Run a policy again after the processes in changed were edited, reusing previous, a checkpointed
+# result of the same policy on the workload before the edit. earliest is the first time an edited
+# process arrived, before or after the edit: everything before it is unchanged, so the run resumes
+# from the last checkpoint before it and only the rest of the schedule is simulated again
+def rerun_policy(workload, policy, previous, changed, earliest):
+    checkpoints = previous.checkpoints
+    k = bisect.bisect_left(checkpoints, earliest, key=lambda checkpoint: checkpoint.time) if checkpoints else 0
+    if k == 0:
+        return run_policy(workload, policy, checkpoints=True)
+    checkpoint = checkpoints[k - 1]
+    arrival_times = workload.arrival_times
+    burst_times = workload.burst_times
+    changed = set(changed)
+
+    # Arrival order: the admitted prefix is unchanged, the edited processes are taken out
+    # of the rest and put back in at their new place (ties in process order)
+    cursor = checkpoint.next_arrival
+    rest = [i for i in previous.arrival_order[cursor:] if i not in changed]
+    for i in changed:
+        if burst_times[i] > 0 or policy.runs_empty_jobs:
+            bisect.insort(rest, i, key=lambda j: (arrival_times[j], j))
+    arrival_order = previous.arrival_order[:cursor] + array("q", rest)
+
+    # Processes completed before the checkpoint keep their times; the others complete again
+    completion_times = array("q", previous.completion_times)
+    for i in changed:
+        completion_times[i] = 0
+    completed = list(changed)
+
+    def on_complete(process, time):
+        completion_times[process] = time
+        completed.append(process)
+
+    log_process = previous.log_process[:checkpoint.segments]
+    log_start = previous.log_start[:checkpoint.segments]
+    log_end = previous.log_end[:checkpoint.segments]
+    new_checkpoints = checkpoints[:k]
+    for process, start, end in simulate(workload, policy, on_complete, arrival_order, checkpoints=new_checkpoints, resume=checkpoint):
+        log_process.append(process)
+        log_start.append(start)
+        log_end.append(end)
+
+    turnaround_times = array("q", previous.turnaround_times)
+    waiting_times = array("q", previous.waiting_times)
+    for i in completed:
+        if policy.every_process or burst_times[i] > 0:
+            turnaround_times[i] = completion_times[i] - arrival_times[i]
+            waiting_times[i] = turnaround_times[i] - burst_times[i]
+        else:
+            turnaround_times[i] = waiting_times[i] = 0
+
+    result = ScheduleResult(workload.names, completion_times, turnaround_times, waiting_times, log_process, log_start, log_end)
+    result.checkpoints = new_checkpoints
+    result.arrival_order = arrival_order
+    return result
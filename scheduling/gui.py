@@ -0,0 +1,644 @@
+# Tk front end: the input form, Gantt charts and process tables
+# Only imported when the GUI is used, so the engine modules stay importable without tkinter or a display
+import bisect
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+import tkinter as tk
+from tkinter import filedialog, ttk, Canvas
+
+from .algorithms import ALGORITHMS, ALGORITHM_TITLES, profile_algorithm, run_algorithm
+from .cache import ResultCache
+from .model import Workload
+from .runfile import RUN_FILE_EXTENSION, load_run
+from .stats import calc_stats, extended_stats
+
+
+# Gantt chart of one ScheduleResult on a Tk canvas that only draws the part in view
+# Segments narrower than MIN_BAR_WIDTH pixels are merged into aggregated bars, so the number of
+# canvas items stays bounded by the canvas width however long the execution log is
+class GanttChart:
+    MARGIN = 20  # Space left and right of the chart, in pixels
+    BAR_Y = 20  # Top of the bars
+    BAR_HEIGHT = 30
+    MIN_BAR_WIDTH = 3  # Narrower segments are merged with their neighbours
+    DEFAULT_SCALE = 20  # Pixels per time unit when the chart opens
+    MAX_SCALE = 200
+
+    def __init__(self, parent, result, width=700, height=80):
+        self.result = result
+        self.log_process = result.log_process
+        self.log_start = result.log_start
+        self.log_end = result.log_end
+        self.names = result.names
+
+        # Time span of the chart
+        self.first_time = self.log_start[0] if len(self.log_start) else 0
+        self.last_time = self.log_end[-1] if len(self.log_end) else 0
+
+        self.scale = self.DEFAULT_SCALE  # Pixels per time unit
+        self.view_start = self.first_time  # Time at the left edge of the view
+
+        self.frame = tk.Frame(parent, bg="#f4ede5")
+        self.canvas = Canvas(self.frame, width=width, height=height, bg="#f4ede5", highlightthickness=1, highlightbackground="#f4ede5")
+        self.canvas.pack(fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.scroll)
+        self.scrollbar.pack(fill="x")
+
+        # zoom controls
+        controls = tk.Frame(self.frame, bg="#f4ede5")
+        controls.pack()
+        ttk.Button(controls, text="-", width=3, command=lambda: self.zoom(0.5)).pack(side="left")
+        ttk.Button(controls, text="+", width=3, command=lambda: self.zoom(2)).pack(side="left")
+        ttk.Button(controls, text="Fit", width=4, command=self.fit).pack(side="left")
+
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<Control-MouseWheel>", lambda event: self.zoom(2 if event.delta > 0 else 0.5, event.x))
+        self.canvas.bind("<Control-Button-4>", lambda event: self.zoom(2, event.x))
+        self.canvas.bind("<Control-Button-5>", lambda event: self.zoom(0.5, event.x))
+
+    def pack(self, **options):
+        self.frame.pack(**options)
+
+    # Width available for the bars, in pixels
+    def chart_width(self):
+        return max(self.canvas.winfo_width() - 2 * self.MARGIN, 1)
+
+    # Smallest scale, where the whole chart fits in the view
+    def min_scale(self):
+        return min(self.chart_width() / max(self.last_time - self.first_time, 1), self.DEFAULT_SCALE)
+
+    def visible_time(self):
+        return self.chart_width() / self.scale
+
+    # Keep the view inside the chart
+    def clamp_view(self):
+        self.scale = min(max(self.scale, self.min_scale()), self.MAX_SCALE)
+        latest_start = max(self.last_time - self.visible_time(), self.first_time)
+        self.view_start = min(max(self.view_start, self.first_time), latest_start)
+
+    def zoom(self, factor, anchor_x=None):
+        # Keep the time under anchor_x (the middle of the view by default) in place
+        if anchor_x is None:
+            anchor_x = self.MARGIN + self.chart_width() / 2
+        anchor_time = self.view_start + (anchor_x - self.MARGIN) / self.scale
+        self.scale *= factor
+        self.clamp_view()
+        self.view_start = anchor_time - (anchor_x - self.MARGIN) / self.scale
+        self.redraw()
+
+    def fit(self):
+        self.scale = self.min_scale()
+        self.view_start = self.first_time
+        self.redraw()
+
+    # Scrollbar command: ("moveto", fraction) or ("scroll", count, "units" or "pages")
+    def scroll(self, action, amount, unit=None):
+        span = max(self.last_time - self.first_time, 1)
+        if action == "moveto":
+            self.view_start = self.first_time + float(amount) * span
+        else:
+            step = self.visible_time() * (0.9 if unit == "pages" else 0.1)
+            self.view_start += int(amount) * step
+        self.redraw()
+
+    def redraw(self):
+        canvas = self.canvas
+        canvas.delete("all")
+        self.clamp_view()
+
+        log_start, log_end = self.log_start, self.log_end
+        scale = self.scale
+        view_start = self.view_start
+        view_end = view_start + self.visible_time()
+        y0, y1 = self.BAR_Y, self.BAR_Y + self.BAR_HEIGHT
+
+        # Center the chart when it is narrower than the view
+        span_width = (self.last_time - self.first_time) * scale
+        origin = self.MARGIN + max((self.chart_width() - span_width) / 2, 0)
+
+        def x_of(time):
+            return origin + (time - view_start) * scale
+
+        # Only the segments that overlap the view
+        index = bisect.bisect_right(log_end, view_start)
+        stop = bisect.bisect_left(log_start, view_end)
+        label_right = -1  # Right edge of the last time label, to avoid overlapping labels
+
+        while index < stop:
+            x0 = max(x_of(log_start[index]), origin - self.MARGIN)
+            x1 = x_of(log_end[index])
+
+            if x1 - x0 >= self.MIN_BAR_WIDTH:
+                # Wide enough for its own bar
+                canvas.create_rectangle(x0, y0, x1, y1, fill="#f1968e", outline="#000")
+                name = str(self.names[self.log_process[index]])
+                if x1 - x0 >= 8 * len(name):
+                    canvas.create_text((x0 + x1) / 2, y0 + 15, text=name, font=("Arial", 10))
+                if x0 > label_right:
+                    label = canvas.create_text(x0, y1 + 10, text=log_start[index], anchor=tk.NW, font=("Arial", 8))
+                    label_right = canvas.bbox(label)[2] + 4
+                index += 1
+            else:
+                # Merge every segment that starts within the next few pixels into one aggregated bar
+                merged_stop = max(bisect.bisect_left(log_start, view_start + (x0 + self.MIN_BAR_WIDTH - origin) / scale, index, stop), index + 1)
+                # but leave out a last segment that is wide enough for its own bar
+                if merged_stop - 1 > index and x_of(log_end[merged_stop - 1]) - x_of(log_start[merged_stop - 1]) >= self.MIN_BAR_WIDTH:
+                    merged_stop -= 1
+                x1 = x_of(log_end[merged_stop - 1])
+                canvas.create_rectangle(x0, y0, max(x1, x0 + 1), y1, fill="#c97b74", outline="")
+                index = merged_stop
+
+        # Ensure the end time of the chart is displayed when it is in view
+        if len(log_end) and self.last_time <= view_end:
+            canvas.create_text(x_of(self.last_time), y1 + 10, text=self.last_time, anchor=tk.NW, font=("Arial", 8))
+
+        # Scrollbar shows the part of the chart in view
+        span = max(self.last_time - self.first_time, 1)
+        self.scrollbar.set((view_start - self.first_time) / span, min((view_end - self.first_time) / span, 1))
+
+
+# Process table over the result arrays that only materializes the rows in view
+# The Treeview keeps a fixed set of row items that are refilled on scroll, sort or a new result,
+# and sorting is done over the arrays, so a table of any size costs one screen of rows in Tk
+class ProcessTable:
+    COLUMNS = ("Process", "Arrival Time", "Burst Time", "Priority", "Completion Time", "Turnaround Time", "Waiting Time")
+    HEADINGS = ("Process", "Arrival Time", "Burst Time", "Priority", "Finishing Time", "Turnaround Time", "Waiting Time")
+    WIDTHS = (100, 100, 100, 100, 100, 120, 120)
+
+    def __init__(self, parent, processes, arrival_times, burst_times, priorities, height=8):
+        self.input_columns = [processes, arrival_times, burst_times, priorities]
+        self.workload = Workload(processes, burst_times, arrival_times, priorities)  # For the extended statistics
+        self.columns = self.input_columns  # Input columns followed by the shown result's columns
+        self.result = None
+        self.height = height  # Number of rows in view
+        self.offset = 0  # Position of the first row in view
+        self.sort_column = None  # Index of the column sorted on, None for process order
+        self.sort_reverse = False
+        self.sort_orders = {}  # (column index, result or None) -> process ids in sorted order
+        self.metrics = {}  # result -> its extended_stats, computed the first time it is shown
+
+        self.frame = tk.Frame(parent, bg="#f4ede5")
+
+        # Process table (aligned to the left)
+        table_frame = tk.Frame(self.frame, bg="#f4ede5")
+        table_frame.grid(row=0, column=0, padx=20, sticky="nw")
+
+        self.tree = ttk.Treeview(table_frame, columns=self.COLUMNS, show="headings", height=height, selectmode="none")
+        for index, (column, width) in enumerate(zip(self.COLUMNS, self.WIDTHS)):
+            self.tree.heading(column, command=lambda index=index: self.sort_by(index))
+            self.tree.column(column, width=width, anchor=tk.CENTER)
+        self.tree.pack(side="left")
+
+        self.scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.scroll)
+        self.scrollbar.pack(side="left", fill="y")
+
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll("scroll", -1 if event.delta > 0 else 1, "units") or "break")
+        self.tree.bind("<Button-4>", lambda event: self.scroll("scroll", -1, "units") or "break")
+        self.tree.bind("<Button-5>", lambda event: self.scroll("scroll", 1, "units") or "break")
+
+        # Statistics summary (aligned to the right)
+        summary_frame = tk.Frame(self.frame, bg="#f4ede5")
+        summary_frame.grid(row=0, column=1, padx=50, sticky="ne")
+
+        ttk.Label(summary_frame, text="Statistics Summary", font=("Arial", 14, "bold"), background="#f4ede5").grid(row=0, column=0, pady=10, sticky="w")
+        self.summary_labels = []
+        for row in range(1, 16):
+            label = ttk.Label(summary_frame, text="", font=("Arial", 10), background="#f4ede5")
+            label.grid(row=row, column=0, sticky="w")
+            self.summary_labels.append(label)
+
+        # Row items, created once and refilled
+        self.items = [self.tree.insert("", tk.END, values=()) for _ in range(min(height, len(processes)))]
+        self.update_headings()
+
+    def pack(self, **options):
+        self.frame.pack(**options)
+
+    # Show another result in the same widgets, keeping the scroll position and sort column
+    def show(self, result, result_stat):
+        self.result = result
+        self.columns = self.input_columns + [result.completion_times, result.turnaround_times, result.waiting_times]
+
+        total_turnaround, avg_turnaround, total_waiting, avg_waiting = result_stat
+        self.summary_labels[0].config(text=f"Total Turnaround Time: {total_turnaround}")
+        self.summary_labels[1].config(text=f"Average Turnaround Time: {avg_turnaround:.2f}")
+        self.summary_labels[2].config(text=f"Total Waiting Time: {total_waiting}")
+        self.summary_labels[3].config(text=f"Average Waiting Time: {avg_waiting:.2f}")
+
+        metrics = self.metrics.get(result)
+        if metrics is None:
+            metrics = self.metrics[result] = extended_stats(self.workload, result)
+        self.summary_labels[4].config(text=f"Average Response Time: {metrics['avg_response']:.2f}")
+        self.summary_labels[5].config(text=f"Waiting Time p50: {metrics['p50_waiting']:.2f}")
+        self.summary_labels[6].config(text=f"Waiting Time p95: {metrics['p95_waiting']:.2f}")
+        self.summary_labels[7].config(text=f"Waiting Time p99: {metrics['p99_waiting']:.2f}")
+        self.summary_labels[8].config(text=f"Turnaround Time p50: {metrics['p50_turnaround']:.2f}")
+        self.summary_labels[9].config(text=f"Turnaround Time p95: {metrics['p95_turnaround']:.2f}")
+        self.summary_labels[10].config(text=f"Turnaround Time p99: {metrics['p99_turnaround']:.2f}")
+        self.summary_labels[11].config(text=f"Throughput: {metrics['throughput']:.4f} processes/unit")
+        self.summary_labels[12].config(text=f"CPU Utilization: {metrics['cpu_utilization']:.1%}")
+        self.summary_labels[13].config(text=f"Idle Time: {metrics['idle_time']}")
+        self.summary_labels[14].config(text=f"Context Switches: {metrics['context_switches']}")
+        self.refresh()
+
+    def row_count(self):
+        return len(self.input_columns[0])
+
+    # Sort on a column, or reverse the order when it is already sorted on it
+    def sort_by(self, column):
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        self.offset = 0
+        self.update_headings()
+        self.refresh()
+
+    def update_headings(self):
+        for index, (column, heading) in enumerate(zip(self.COLUMNS, self.HEADINGS)):
+            arrow = (" ▼" if self.sort_reverse else " ▲") if index == self.sort_column else ""
+            self.tree.heading(column, text=heading + arrow)
+
+    # Process ids in the current sort order; input columns are sorted once for every result
+    def sort_order(self):
+        if self.sort_column is None:
+            return None
+        key = (self.sort_column, self.result if self.sort_column >= len(self.input_columns) else None)
+        order = self.sort_orders.get(key)
+        if order is None:
+            column = self.columns[self.sort_column]
+            order = array("q", sorted(range(self.row_count()), key=column.__getitem__))
+            self.sort_orders[key] = order
+        return order
+
+    # Scrollbar command: ("moveto", fraction) or ("scroll", count, "units" or "pages")
+    def scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.offset = int(float(amount) * self.row_count())
+        else:
+            self.offset += int(amount) * (self.height if unit == "pages" else 1)
+        self.refresh()
+
+    def refresh(self):
+        count = self.row_count()
+        self.offset = min(max(self.offset, 0), max(count - len(self.items), 0))
+        order = self.sort_order()
+
+        for position, item in enumerate(self.items, start=self.offset):
+            if self.sort_reverse:
+                position = count - 1 - position
+            i = order[position] if order is not None else position
+            self.tree.item(item, values=tuple(column[i] for column in self.columns))
+
+        if count:
+            self.scrollbar.set(self.offset / count, (self.offset + len(self.items)) / count)
+
+
+# How often the GUI checks on running simulations, in milliseconds
+POLL_INTERVAL = 50
+
+
+# Function to create the GUI and handle user inputs
+def create_simulation():
+
+    executor = None  # Process pool running the simulations, created on the first run
+    futures = None  # Futures of the run in progress, None when idle
+    result_cache = ResultCache()  # Results of earlier runs in this session
+
+    # start simulations
+    def start_simulation():
+        nonlocal executor, futures
+        try:
+            # Retrieve user inputs for number of processes and quantum time
+            num_processes = int(num_processes_entry.get())
+            quantum = int(quantum_entry.get())
+
+            # Validate the number of processes
+            if not (3 <= num_processes <= 10):
+                raise ValueError("Number of processes must be between 3 and 10.")
+
+            # Generate process names, if added the name, then use the name, else default PN
+            process_names_input = process_name_entry.get().split()
+            processes = [process_names_input[i] if i < len(process_names_input) else f"P{i}" for i in range(num_processes)]
+            
+            # parse burst times and arrival times
+            burst_times = list(map(int, burst_time_entry.get().split()))
+            arrival_times = list(map(int, arrival_time_entry.get().split()))
+            priority = list(map(int, priority_entry.get().split())) 
+
+            # Validate the inputs for burst and arrival times
+            if len(burst_times) != num_processes or len(arrival_times) != num_processes or len(priority) != num_processes:
+                raise ValueError("Mismatch in number of processes and input details.")
+
+            workload = Workload(processes, burst_times, arrival_times, priority)
+        except ValueError as e:
+            # Display error messages for invalid inputs
+            error_label.config(text=f"Error: {str(e)}")
+            return
+
+        # Run the four algorithms in parallel worker processes, the results are collected by poll_simulation
+        # Results of earlier runs with the same inputs come straight from the cache, unless the runs are
+        # profiled: then every algorithm really runs and its instrumentation report comes back with it
+        profile = profile_var.get()
+        keys = [result_cache.key(algorithm, workload, quantum) for algorithm in ALGORITHMS]
+        futures = []
+        for algorithm, key in zip(ALGORITHMS, keys):
+            cached = None if profile else result_cache.get(key)
+            if cached is not None:
+                future = Future()
+                future.set_result(cached)
+            else:
+                if executor is None:
+                    executor = ProcessPoolExecutor(max_workers=len(ALGORITHMS))
+                future = executor.submit(profile_algorithm if profile else run_algorithm, algorithm, workload, quantum)
+            futures.append(future)
+        inputs = (processes, burst_times, arrival_times, priority)
+
+        # Busy state until the results arrive or the run is cancelled
+        error_label.config(text="")
+        start_button.config(state=tk.DISABLED)
+        cancel_button.config(state=tk.NORMAL)
+        progress.config(value=0)
+        progress_label.config(text=f"Running simulations... 0/{len(futures)}")
+        root.after(POLL_INTERVAL, poll_simulation, futures, keys, inputs)
+
+    # check the running simulations without blocking the event loop
+    def poll_simulation(run_futures, keys, inputs):
+        if run_futures is not futures:
+            return  # This run was cancelled or replaced
+
+        finished = sum(future.done() for future in run_futures)
+        progress.config(value=finished)
+        progress_label.config(text=f"Running simulations... {finished}/{len(run_futures)}")
+        if finished < len(run_futures):
+            root.after(POLL_INTERVAL, poll_simulation, run_futures, keys, inputs)
+            return
+
+        end_simulation()
+        try:
+            outputs = [future.result() for future in run_futures]
+        except Exception as e:
+            error_label.config(text=f"Error: {str(e)}")
+            return
+
+        for key, output in zip(keys, outputs):
+            result_cache.put(key, output[:2])
+
+        # Add to the results and stats list
+        results = [output[0] for output in outputs]
+        results_stats = [output[1] for output in outputs]
+        # Instrumentation reports of profiled runs
+        reports = [output[2] if len(output) > 2 else None for output in outputs]
+
+        # Display the results in a new window
+        display_results(*inputs, results, results_stats, reports)
+
+    # cancel the running simulations
+    def cancel_simulation():
+        nonlocal executor
+        if executor is not None:
+            shutdown_executor(executor)
+            executor = None
+        end_simulation()
+        progress_label.config(text="Simulation cancelled.")
+
+    # leave the busy state
+    def end_simulation():
+        nonlocal futures
+        futures = None
+        start_button.config(state=tk.NORMAL)
+        cancel_button.config(state=tk.DISABLED)
+        progress.config(value=0)
+        progress_label.config(text="")
+
+    # stop the pool without waiting; running workers cannot be cancelled through their futures,
+    # so they are terminated instead of being left to finish a long run
+    def shutdown_executor(pool):
+        workers = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for worker in workers:
+            worker.terminate()
+
+    def on_close():
+        if executor is not None:
+            shutdown_executor(executor)
+        root.destroy()
+
+    # open a run saved by save_run (e.g. by the CLI's --save-runs) and show it without simulating;
+    # its columns stay memory-mapped, the chart and table only read what they show
+    def open_saved_run():
+        path = filedialog.askopenfilename(parent=root, title="Open Saved Run",
+                                          filetypes=[("Saved runs", "*" + RUN_FILE_EXTENSION), ("All files", "*")])
+        if not path:
+            return
+        try:
+            saved = load_run(path)
+        except (OSError, ValueError) as e:
+            error_label.config(text=f"Error: {str(e)}")
+            return
+        error_label.config(text="")
+        workload, result = saved.workload, saved.result
+        display_results(workload.names, workload.burst_times, workload.arrival_times, workload.priorities,
+                        [result], [calc_stats(result)], algorithms=[saved.algorithm])
+
+    def display_results(processes, burst_times, arrival_times, priority, results, result_stats, reports=None, algorithms=ALGORITHMS):
+        
+        # Create a new window to display the results
+        results_window = tk.Toplevel(root)
+        results_window.title("Simulation Results")
+        results_window.geometry("800x800")
+        results_window.configure(bg="#f4ede5")
+
+        
+        canvas = tk.Canvas(results_window, bg="#f4ede5")
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Add a vertical scrollbar
+        scrollbar = ttk.Scrollbar(results_window, orient=tk.VERTICAL, command=canvas.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Link the scrollbar to the canvas
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Create a frame inside the canvas for content
+        content_frame = tk.Frame(canvas, bg="#f4ede5")
+        canvas.create_window((0, 0), window=content_frame, anchor="n")
+
+        def resize_canvas(event=None):
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        content_frame.bind("<Configure>", resize_canvas)
+       # content_frame.pack(expand=True, fill="both", anchor="center")
+
+
+        title_label = ttk.Label(content_frame, text="Gantt Chart", font=("Arial", 14, "bold"), background="#f4ede5")
+        title_label.pack(pady=(30, 0), anchor="center") 
+
+        # algorithm names
+        algorithm_names = [ALGORITHM_TITLES.get(algorithm, algorithm) for algorithm in algorithms]
+
+        # canvases for Gantt charts
+        canvas_frame = tk.Frame(content_frame, bg="#f4ede5")
+        canvas_frame.pack(pady=(0, 10))
+
+        # create canvas dynamically
+        gantt_canvases = []
+        for index, result in enumerate(results):
+            scheduling_label = ttk.Label(canvas_frame, text=f"{chr(97 + index)}) {algorithm_names[index]}", 
+                                     font=("Arial", 10, "italic"), background="#f4ede5")
+            scheduling_label.pack(pady=(5, 0))
+
+            # the chart only draws what is in view, so its width no longer grows with the log
+            canvas_width = min(len(result.log_process) * 60, 700)
+            gantt_chart = GanttChart(canvas_frame, result, width=canvas_width, height=80)
+            gantt_chart.pack(fill="both", expand=True, pady=(0, 10))
+
+            gantt_canvases.append((gantt_chart, result, result_stats[index]))
+
+        # Center the starting position based on the canvas width
+        # Bind the resize event to redraw the Gantt chart dynamically
+        # gantt_canvas_rr.bind("<Configure>", lambda event: draw_gantt_chart(gantt_canvas_rr, result))
+        
+
+        # Display process table
+        # Create a frame to hold the table and statistics
+        
+        label_title = ttk.Label(content_frame, text="Process Table", font=("Arial", 14, "bold"), background="#f4ede5")
+        label_title.pack(pady=(0, 10))
+        #ttk.Label(content_frame, text="Process Table", font=("Arial", 14, "bold"), background="#f4ede5").pack(pady=(0,10))
+        
+        # one table for every algorithm, refilled when the selection changes
+        process_table = ProcessTable(content_frame, processes, arrival_times, burst_times, priority)
+        process_table.pack(pady=(10,20))
+
+        # instrumentation report of the selected algorithm, only shown for profiled runs
+        # (packed below the dropdown)
+        profile_label = ttk.Label(content_frame, text="", font=("Courier", 10), background="#f4ede5", justify="left")
+
+        def update_process_table(result, result_stat):
+            process_table.show(result, result_stat)
+
+        def update_profile(report):
+            if report is None:
+                profile_label.config(text="")
+                return
+            profile_label.config(text="\n".join([
+                "Run Profile",
+                f"Wall time: {report['wall_time'] * 1000:.3f} ms",
+                f"Scheduling decisions: {report['decisions']}",
+                f"Context switches: {report['context_switches']}",
+                f"Queue operations: {report['queue_ops']}",
+                f"Peak ready queue: {report['peak_ready']}",
+                f"Idle jumps: {report['idle_jumps']} ({report['idle_ticks_skipped']} ticks skipped)",
+            ]))
+
+        def dropdown_with_results(results_window, gantt_canvases):
+            dropdown_frame = ttk.Frame(results_window)
+            dropdown_frame.pack(pady=(0,10))
+
+            ttk.Label(dropdown_frame, text="Select a Process Table to View:").pack(side="left", padx=5)
+            
+            # Create dropdown options
+            options = algorithm_names
+            
+            # Define a variable to track the selected option
+            selected_option = tk.StringVar()
+            selected_option.set(options[0])  # Set the default value
+
+            # Dropdown combobox
+            dropdown = ttk.Combobox(dropdown_frame, values=options, textvariable=selected_option, state="readonly", width=25)
+            dropdown.pack(side="left", padx=5)
+
+            # Button to trigger update based on selected dropdown option
+            
+            def on_selection(event = None):
+                # Get the selected algorithm
+                selected_algorithm = selected_option.get()
+                
+                # Update the label title to reflect the selected algorithm
+                label_title.config(text=f"{selected_algorithm} Process Table")
+                
+                # Update the process table based on the selection
+                index = options.index(selected_option.get())
+                _, result, result_stat = gantt_canvases[index]
+                update_process_table(result, result_stat)
+                update_profile(reports[index] if reports else None)
+
+            dropdown.bind("<<ComboboxSelected>>", on_selection)
+            on_selection()
+
+        # Display the first process table by default
+        if gantt_canvases:
+            first_result, first_stat = gantt_canvases[0][1], gantt_canvases[0][2]
+            dropdown_with_results(content_frame, gantt_canvases)
+            profile_label.pack(pady=(0, 20))
+
+    # Create the main window
+    root = tk.Tk()
+    root.title("Scheduling Simulator")
+    root.configure(bg="#f4ede5")
+    root.geometry("700x480")
+
+    ttk.Label(root, text="Scheduling Simulator", font=("Arial", 16, "bold"), background="#f4ede5").pack(pady=(40,10))
+
+    form_frame = tk.Frame(root, bg="#f4ede5") 
+    form_frame.pack(pady=10)
+
+    ttk.Label(form_frame, text="Number of Processes (3-10):", font=("Arial", 11, "bold"), background="#f4ede5").grid(row=0, column=0, sticky=tk.W, pady=5)
+    num_processes_entry = ttk.Entry(form_frame, font=("Arial", 11, "bold"))
+    num_processes_entry.grid(row=0, column=1, pady=5)
+
+    ttk.Label(form_frame, text="Process names (space-separated, optional):", font=("Arial", 11, "bold"), background="#f4ede5").grid(row=1, column=0, sticky=tk.W, pady=5)
+    process_name_entry = ttk.Entry(form_frame, font=("Arial", 11, "bold"))
+    process_name_entry.grid(row=1, column=1, pady=5)
+
+    ttk.Label(form_frame, text="Burst Times (space-separated):", font=("Arial", 11, "bold"), background="#f4ede5").grid(row=2, column=0, sticky=tk.W, pady=5)
+    burst_time_entry = ttk.Entry(form_frame, font=("Arial", 11, "bold"))
+    burst_time_entry.grid(row=2, column=1, pady=5)
+
+    ttk.Label(form_frame, text="Arrival Times (space-separated):", font=("Arial", 11, "bold"), background="#f4ede5").grid(row=3, column=0, sticky=tk.W, pady=5)
+    arrival_time_entry = ttk.Entry(form_frame, font=("Arial", 11, "bold"))
+    arrival_time_entry.grid(row=3, column=1, pady=5)
+
+    # put at last because time quantum is only for round robin
+    ttk.Label(form_frame, text="Time Quantum:", font=("Arial", 11, "bold"), background="#f4ede5").grid(row=4, column=0, sticky=tk.W, pady=5)
+    quantum_entry = ttk.Entry(form_frame, font=("Arial", 11, "bold"))
+    quantum_entry.grid(row=4, column=1, pady=5)
+
+    # for priority
+    ttk.Label(form_frame, text="Priority (space-separated):", font=("Arial", 11, "bold"), background="#f4ede5").grid(row=5, column=0, sticky=tk.W, pady=5)
+    priority_entry = ttk.Entry(form_frame, font=("Arial", 11, "bold"))
+    priority_entry.grid(row=5, column=1, pady=5)
+
+    
+
+    # profiled runs skip the cache and report their counters and timings with the results
+    profile_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(form_frame, text="Profile runs", variable=profile_var).grid(row=6, column=1, sticky=tk.W, pady=5)
+
+    error_label = tk.Label(root, text="", fg="red", bg="#f4ede5", font=("Arial", 10))
+    error_label.pack()
+    
+    style = ttk.Style()
+    style.theme_use("clam")  # Try "alt", "default", or "classic" as well
+    style.configure("Custom.TButton", background="#f29491", foreground="black", font=("Arial", 10, "bold"), highlightthickness=1, highlightbackground="#f4ede5")
+
+    # progress of a running simulation
+    progress_frame = tk.Frame(root, bg="#f4ede5")
+    progress_frame.pack()
+    progress = ttk.Progressbar(progress_frame, mode="determinate", maximum=len(ALGORITHMS), length=200)
+    progress.pack(side="left", padx=5)
+    progress_label = tk.Label(progress_frame, text="", bg="#f4ede5", font=("Arial", 10))
+    progress_label.pack(side="left", padx=5)
+
+    button_frame = tk.Frame(root, bg="#f4ede5")
+    button_frame.pack(pady=20)
+    start_button = ttk.Button(button_frame, text="Start Simulation", style="Custom.TButton", command=start_simulation)
+    start_button.pack(side="left", padx=5)
+    cancel_button = ttk.Button(button_frame, text="Cancel", style="Custom.TButton", command=cancel_simulation, state=tk.DISABLED)
+    cancel_button.pack(side="left", padx=5)
+    ttk.Button(button_frame, text="Open Saved Run...", style="Custom.TButton", command=open_saved_run).pack(side="left", padx=5)
+
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    root.mainloop()
@@ -0,0 +1,103 @@
+# Column-oriented workloads, process-name tables and schedule results
+from array import array
+
+
+# Compact, column-oriented set of processes to schedule
+# Each column is an int64 array indexed by process id; names is the process-name table
+class Workload:
+    def __init__(self, names, burst_times, arrival_times, priorities=None):
+        self.names = names  # Process names, indexed by process id
+        self.burst_times = _int_column(burst_times)
+        self.arrival_times = _int_column(arrival_times)
+        # Priorities are only used by the priority scheduler, default to all 0
+        self.priorities = _int_column(priorities) if priorities is not None else _zeros(len(self.burst_times))
+
+        if not (len(self.names) == len(self.burst_times) == len(self.arrival_times) == len(self.priorities)):
+            raise ValueError("Mismatch in number of processes and input details.")
+
+    def __len__(self):
+        return len(self.burst_times)
+
+
+# Process names packed into one buffer, for traces too large to keep a str object per process
+# Can be used as the names of a Workload in place of a list
+class NameTable:
+    def __init__(self, names=()):
+        self._data = bytearray()  # UTF-8 names back to back
+        self._offsets = array("q", [0])  # Start of each name in _data, plus the end of the last one
+        self.extend(names)
+
+    # Read-only table over existing buffers, e.g. the name section of a memory-mapped run file
+    @classmethod
+    def from_buffers(cls, data, offsets):
+        table = cls.__new__(cls)
+        table._data = data
+        table._offsets = offsets
+        return table
+
+    def append(self, name):
+        self._data += name.encode()
+        self._offsets.append(len(self._data))
+
+    def extend(self, names):
+        for name in names:
+            self.append(name)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        return str(self._data[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+
+# Result of one scheduling run, in the same column-oriented form as Workload
+# The execution log is kept as three parallel arrays (process id, start, end) instead of name tuples
+class ScheduleResult:
+    # Set on results run with checkpoints: the run's Checkpoint list and arrival order, for re-runs after an edit
+    checkpoints = None
+    arrival_order = None
+
+    def __init__(self, names, completion_times, turnaround_times, waiting_times, log_process, log_start, log_end):
+        self.names = names  # Process-name table used to resolve log_process ids
+        self.completion_times = completion_times
+        self.turnaround_times = turnaround_times
+        self.waiting_times = waiting_times
+        self.log_process = log_process
+        self.log_start = log_start
+        self.log_end = log_end
+
+    def __len__(self):
+        return len(self.completion_times)
+
+    @property
+    def execution_log(self):
+        # (name, start, end) tuples, built on demand
+        names = self.names
+        return [(names[p], start, end) for p, start, end in zip(self.log_process, self.log_start, self.log_end)]
+
+    def __getitem__(self, index):
+        # Index like the old (completion, turnaround, waiting, execution_log) tuple;
+        # the execution log is only built when it is asked for
+        column = (self.completion_times, self.turnaround_times, self.waiting_times, None)[index]
+        return self.execution_log if column is None else column
+
+    def as_tuple(self):
+        # Convert to the list-based (completion, turnaround, waiting, execution_log) tuple
+        return list(self.completion_times), list(self.turnaround_times), list(self.waiting_times), self.execution_log
+
+
+# int64 array of the values, reusing them as-is when they already are one
+# (an int64 memoryview, e.g. over shared memory, is used as-is too)
+def _int_column(values):
+    if isinstance(values, array) and values.typecode == "q":
+        return values
+    if isinstance(values, memoryview) and values.format == "q":
+        return values
+    return array("q", values)
+
+
+# Zero-filled int64 array of length n
+def _zeros(n):
+    return array("q", bytes(8 * n))
@@ -0,0 +1,220 @@
+# Scheduling on several cores from one global event heap
+import heapq
+from array import array
+
+from .algorithms import make_policy
+from .engine import _arrival_order, _time_slice, _turnaround_and_waiting
+from .model import ScheduleResult, _zeros
+
+
+# Result of a multi-core run: a ScheduleResult whose log columns hold every core's segments, core by core,
+# with log_core telling which core ran each segment; core_logs keeps one (process, start, end) log per core
+class MulticoreResult(ScheduleResult):
+    def __init__(self, names, completion_times, turnaround_times, waiting_times, core_logs):
+        log_process, log_start, log_end, log_core = array("q"), array("q"), array("q"), array("q")
+        for core, (core_process, core_start, core_end) in enumerate(core_logs):
+            log_process.extend(core_process)
+            log_start.extend(core_start)
+            log_end.extend(core_end)
+            log_core.extend([core] * len(core_process))
+        super().__init__(names, completion_times, turnaround_times, waiting_times, log_process, log_start, log_end)
+        self.log_core = log_core
+        self.core_logs = core_logs
+
+    # (name, start, end) execution log of one core
+    def core_log(self, core):
+        names = self.names
+        return [(names[p], start, end) for p, start, end in zip(*self.core_logs[core])]
+
+
+# Simulate any policy make_policy knows on m identical cores, driven by a global event heap
+# queues="global" shares one ready queue between all cores, so jobs can move between cores;
+# queues="per-core" gives each core its own queue and sends each arriving job to the least loaded core.
+# Each queue is its own instance of the policy, driven by the same admit/pop/requeue/time_slice calls as
+# on one CPU: a shared queue knows its next arrival when a job is dispatched, while a per-core queue only
+# learns of it when the arrival is sent there, and the running job's slice is then worked out again.
+# The clock jumps from event to event (arrivals and run ends), so the cost grows with the number of
+# events and not with time. With one core the completion times are the same as the single-CPU functions
+def multicore_schedule(workload, algorithm, cores, quantum=None, queues="global"):
+    if queues not in ("global", "per-core"):
+        raise ValueError(f"Unknown queue layout: {queues}")
+    if cores < 1:
+        raise ValueError("Number of cores must be at least 1.")
+
+    n = len(workload)
+    arrival_times = workload.arrival_times
+    completion_times = _zeros(n)
+    time = 0  # Current time in the simulation
+
+    shared = queues == "global"
+    queue_of_core = [0] * cores if shared else list(range(cores))
+    queue_count = 1 if shared else cores
+    policies = [make_policy(algorithm, workload, quantum) for _ in range(queue_count)]  # Ready queue of each queue
+    time_slice = _time_slice(policies[0])
+    merge_segments = policies[0].merge_segments
+    idle = [[core for core in range(cores) if queue_of_core[core] == queue] for queue in range(queue_count)]  # Min-heaps of idle cores
+    idle_count = cores
+    touched = set()  # Queues that got a job or an idle core since the last dispatch
+
+    running = [None] * cores  # Job on each core
+    run_start = [0] * cores
+    run_remaining = [0] * cores  # Burst time the job had when it was dispatched
+    run_end = [0] * cores
+    generation = [0] * cores  # Bumped when a run is cut short, so the event of its old end is ignored
+    events = []  # Min-heap of (run end, core, generation)
+    core_logs = [(array("q"), array("q"), array("q")) for _ in range(cores)]
+    # With merge_segments, the [job, start, end] segment of each core still being extended
+    last_segment = [None] * cores
+
+    # Per-core queues: jobs not yet completed on each core, with a lazy min-heap of (load, core)
+    load = [0] * cores
+    load_heap = [(0, core) for core in range(cores)]
+    # Jobs sent to a busy core's queue, admitted when the core is next free, like arrivals on one CPU
+    held = [array("q") for _ in range(cores)]
+    holding = set()
+
+    arrival_order = _arrival_order(workload, keep_empty=policies[0].runs_empty_jobs)
+    arrivals = len(arrival_order)
+    next_arrival = 0
+
+    def dispatch(core, job, remaining):
+        nonlocal idle_count
+        idle_count -= 1
+        running[core] = job
+        run_start[core] = time
+        run_remaining[core] = remaining
+        # Run the job for as long as the policy lets it
+        if time_slice is None:
+            run_time = remaining
+        else:
+            run_time = time_slice(remaining, time, arrival_times[arrival_order[next_arrival]] if shared and next_arrival < arrivals else None)
+        run_end[core] = time + run_time
+        heapq.heappush(events, (run_end[core], core, generation[core]))
+
+    def log(core, job, start, end):
+        log_process, log_start, log_end = core_logs[core]
+        log_process.append(job)
+        log_start.append(start)
+        log_end.append(end)
+
+    def stop(core):
+        nonlocal idle_count
+        job = running[core]
+        running[core] = None
+        heapq.heappush(idle[queue_of_core[core]], core)
+        idle_count += 1
+        touched.add(queue_of_core[core])
+        if not merge_segments:
+            log(core, job, run_start[core], time)
+        # A run that carries on the core's last one extends its segment
+        elif last_segment[core] is not None and last_segment[core][0] == job and last_segment[core][2] == run_start[core]:
+            last_segment[core][2] = time
+        else:
+            if last_segment[core] is not None:
+                log(core, *last_segment[core])
+            last_segment[core] = [job, run_start[core], time]
+        return job
+
+    def complete(core, job):
+        completion_times[job] = time
+        if not shared:
+            load[core] -= 1
+            heapq.heappush(load_heap, (load[core], core))
+
+    def least_loaded_core():
+        while load_heap[0][0] != load[load_heap[0][1]]:
+            heapq.heappop(load_heap)  # Stale entry
+        core = load_heap[0][1]
+        load[core] += 1
+        heapq.heappush(load_heap, (load[core], core))
+        return core
+
+    while True:
+        # Processes that have arrived by now
+        first = next_arrival
+        while next_arrival < arrivals and arrival_times[arrival_order[next_arrival]] <= time:
+            next_arrival += 1
+        if not shared:
+            for job in arrival_order[first:next_arrival]:
+                core = least_loaded_core()
+                held[core].append(job)
+                holding.add(core)
+                # A preemptive policy decides again when a job arrives at the queue: cut the running job's slice short if it says so
+                if running[core] is not None and time_slice is not None:
+                    end = run_start[core] + time_slice(run_remaining[core], run_start[core], time)
+                    if end < run_end[core]:
+                        run_end[core] = end
+                        generation[core] += 1
+                        heapq.heappush(events, (end, core, generation[core]))
+
+        # Finish the runs that end now; jobs with time left go back after the new arrivals
+        preempted = []
+        while events and events[0][0] <= time:
+            _, core, run = heapq.heappop(events)
+            if run != generation[core]:
+                continue  # Run that was cut short
+            job = stop(core)
+            remaining = run_remaining[core] - (time - run_start[core])
+            if remaining > 0:
+                preempted.append((core, job, remaining))
+            else:
+                complete(core, job)
+
+        # Admit the arrivals to the ready queues, as one batch per queue
+        if shared:
+            if next_arrival > first:
+                policies[0].admit(arrival_order[first:next_arrival], time)
+                touched.add(0)
+        elif holding:
+            for core in [core for core in holding if running[core] is None]:
+                policies[core].admit(held[core], time)
+                held[core] = array("q")
+                holding.remove(core)
+                touched.add(core)
+        previous_core = {}
+        for core, job, remaining in preempted:
+            policies[queue_of_core[core]].requeue(job, remaining, time)
+            touched.add(queue_of_core[core])
+            previous_core[job] = core
+
+        # Start jobs on the idle cores, lowest core first; a job whose run was just cut short goes
+        # back on the core it ran on when that core is free, so it is not moved for nothing
+        for queue in touched:
+            ready = policies[queue].ready
+            free = idle[queue]
+            pop = policies[queue].pop
+            if not preempted or len(free) == 1:
+                while free and ready:
+                    dispatch(heapq.heappop(free), *pop())
+                continue
+            picked = [pop() for _ in range(min(len(free), len(ready)))]
+            moved = []
+            for job, remaining in picked:
+                core = previous_core.get(job)
+                if core is not None and running[core] is None:
+                    dispatch(core, job, remaining)
+                else:
+                    moved.append((job, remaining))
+            if len(moved) < len(picked):
+                free[:] = [core for core in free if running[core] is None]
+                heapq.heapify(free)
+            for job, remaining in moved:
+                dispatch(heapq.heappop(free), job, remaining)
+        touched.clear()
+
+        # Jump to the next run end, or to the next arrival if it can change anything before then: when a core
+        # is idle to take it, or a per-core queue has to learn of it for a preemptive policy. While every core
+        # is busy, arrivals are otherwise admitted at the next run end, like on a single CPU
+        next_time = events[0][0] if events else None
+        if next_arrival < arrivals and (idle_count or not shared and time_slice is not None):
+            arrival = arrival_times[arrival_order[next_arrival]]
+            next_time = arrival if next_time is None else min(next_time, arrival)
+        if next_time is None:
+            break
+        time = max(time, next_time)
+
+    for core in range(cores):
+        if last_segment[core] is not None:
+            log(core, *last_segment[core])
+    turnaround_times, waiting_times = _turnaround_and_waiting(workload, completion_times, policies[0].every_process)
+    return MulticoreResult(workload.names, completion_times, turnaround_times, waiting_times, core_logs)
@@ -0,0 +1,188 @@
+# Online schedulers fed jobs while the simulation runs
+import heapq
+from array import array
+
+from .algorithms import make_policy
+from .engine import _time_slice
+from .model import ScheduleResult
+from .stats import StatsAccumulator
+
+
+# Online scheduler: any policy make_policy knows, driven incrementally from a live job feed
+# Jobs are submitted while the simulation runs and advance(until) moves the clock forward, keeping the
+# policy's ready queue between calls so each job costs O(log n) instead of a full re-run. The policy
+# is the one the batch run uses, so submitting every process in index order and advancing to the end
+# gives the batch result
+class OnlineScheduler:
+    def __init__(self, algorithm, quantum=None, segment_sink=None):
+        self.clock = 0  # Everything before this time has been simulated
+        self.names = []
+        self.burst_times = array("q")
+        self.arrival_times = array("q")
+        self.priorities = array("q")
+        self.completion_times = array("q")
+        # The policy reads the columns above, which grow as jobs are submitted
+        self.policy = make_policy(algorithm, self, quantum)
+        self.time_slice = _time_slice(self.policy)
+        self.pending = []  # Min-heap of (arrival time, id) for the jobs that have not arrived yet
+        self.running = None  # Job on the CPU
+        self.run_start = 0
+        self.run_remaining = 0  # Burst time the running job had when it was dispatched
+        self.run_end = 0  # When the running job leaves the CPU
+        self.preempted = None  # (id, remaining burst time) to requeue once the arrivals are in
+        self.last_process = None  # Job of the segment being merged, for policies that merge segments
+        self.last_start = 0
+        self.stats = StatsAccumulator(self)  # Running totals of turnaround and waiting time
+        self.segment_sink = segment_sink  # Receives (id, start, end) segments instead of the log when set
+        self.log_process, self.log_start, self.log_end = array("q"), array("q"), array("q")
+
+    def __len__(self):
+        return len(self.burst_times)
+
+    # Add a job and return its id; it arrives now unless a later arrival time is given
+    def submit(self, name, burst_time, arrival_time=None, priority=0):
+        if arrival_time is None:
+            arrival_time = self.clock
+        if arrival_time < self.clock:
+            raise ValueError(f"Arrival time {arrival_time} is before the current time {self.clock}.")
+
+        job = len(self.burst_times)
+        self.names.append(name)
+        self.burst_times.append(burst_time)
+        self.arrival_times.append(arrival_time)
+        self.priorities.append(priority)
+        self.completion_times.append(0)
+        if burst_time > 0 or self.policy.runs_empty_jobs:
+            heapq.heappush(self.pending, (arrival_time, job))
+            # A preemptive policy decides again at the next arrival: when this job is now the next one
+            # and arrives before the running job would leave, the running job's slice is worked out again
+            if self.running is not None and self.time_slice is not None and arrival_time < self.run_end:
+                self.run_end = self.run_start + self.time_slice(self.run_remaining, self.run_start, arrival_time)
+        return job
+
+    # Simulate up to (not including) until; events at exactly until wait for the next call,
+    # so jobs arriving at until can still be submitted
+    def advance(self, until=float("inf")):
+        policy = self.policy
+        while True:
+            if self.running is None:
+                if self.clock >= until:
+                    break
+                self.admit_arrivals()
+                # A preempted job goes back behind the jobs that arrived while it ran
+                if self.preempted is not None:
+                    policy.requeue(self.preempted[0], self.preempted[1], self.clock)
+                    self.preempted = None
+                if not policy.ready:
+                    # Idle: jump to the next arrival, if it comes before until
+                    if not self.pending or self.pending[0][0] >= until:
+                        break
+                    self.clock = max(self.clock, self.pending[0][0])
+                    continue
+                self.dispatch()
+
+            if self.run_end >= until:
+                break
+            self.clock = self.run_end
+            self.finish_run()
+
+        if until != float("inf"):
+            self.clock = max(self.clock, until)
+        # A merged segment is only known to be over once nothing is left to run; it ends when the
+        # last job completed, which is where the final run ended
+        elif self.last_process is not None and self.running is None and not policy.ready:
+            self.log(self.last_process, self.last_start, self.run_end)
+            self.last_process = None
+
+    # Admit the jobs that have arrived by now, as one batch in arrival order
+    def admit_arrivals(self):
+        pending = self.pending
+        if pending and pending[0][0] <= self.clock:
+            arrived = array("q")
+            while pending and pending[0][0] <= self.clock:
+                arrived.append(heapq.heappop(pending)[1])
+            self.policy.admit(arrived, self.clock)
+
+    def dispatch(self):
+        self.running, remaining = self.policy.pop()
+        # A merged segment lasts until a different job is dispatched
+        if self.policy.merge_segments and self.running != self.last_process:
+            if self.last_process is not None:
+                self.log(self.last_process, self.last_start, self.clock)
+            self.last_process, self.last_start = self.running, self.clock
+
+        # Run the job for as long as the policy lets it
+        self.run_start = self.clock
+        self.run_remaining = remaining
+        if self.time_slice is None:
+            self.run_end = self.clock + remaining
+        else:
+            self.run_end = self.clock + self.time_slice(remaining, self.clock, self.pending[0][0] if self.pending else None)
+
+    def finish_run(self):
+        job = self.running
+        self.running = None
+        if not self.policy.merge_segments:
+            self.log(job, self.run_start, self.clock)
+        remaining = self.run_remaining - (self.clock - self.run_start)
+        if remaining > 0:
+            self.preempted = (job, remaining)
+        else:
+            self.complete(job, self.clock)
+
+    def log(self, job, start, end):
+        if self.segment_sink is not None:
+            self.segment_sink(job, start, end)
+        else:
+            self.log_process.append(job)
+            self.log_start.append(start)
+            self.log_end.append(end)
+
+    def complete(self, job, time):
+        self.completion_times[job] = time
+        self.stats(job, time)
+
+    def snapshot(self):
+        return {
+            "clock": self.clock,
+            "running": self.names[self.running] if self.running is not None else None,
+            "ready": len(self.policy.ready),
+            "pending": len(self.pending),
+            "submitted": len(self),
+            "completed": self.stats.completed,
+            "avg_turnaround": self.stats.avg_turnaround,
+            "avg_waiting": self.stats.avg_waiting,
+        }
+
+    # ScheduleResult of the jobs completed so far (turnaround and waiting stay 0 for the others)
+    # As in the batch runs, jobs with no burst time get them only when the policy's every_process is set,
+    # from their completion time so far (0 until they are dispatched, for policies that dispatch them)
+    def result(self):
+        n = len(self)
+        every_process = self.policy.every_process
+        done = [self.completion_times[i] > 0 or (self.burst_times[i] == 0 and every_process) for i in range(n)]
+        turnaround_times = array("q", (self.completion_times[i] - self.arrival_times[i] if done[i] else 0 for i in range(n)))
+        waiting_times = array("q", (turnaround_times[i] - self.burst_times[i] if done[i] else 0 for i in range(n)))
+        return ScheduleResult(list(self.names), array("q", self.completion_times), turnaround_times, waiting_times,
+                              array("q", self.log_process), array("q", self.log_start), array("q", self.log_end))
+
+
+# Online schedulers of the four algorithms by name
+class OnlineRoundRobin(OnlineScheduler):
+    def __init__(self, quantum, segment_sink=None):
+        super().__init__("rr", quantum, segment_sink)
+
+
+class OnlineSJN(OnlineScheduler):
+    def __init__(self, segment_sink=None):
+        super().__init__("sjn", segment_sink=segment_sink)
+
+
+class OnlineSRT(OnlineScheduler):
+    def __init__(self, segment_sink=None):
+        super().__init__("srt", segment_sink=segment_sink)
+
+
+class OnlinePriority(OnlineScheduler):
+    def __init__(self, segment_sink=None):
+        super().__init__("priority", segment_sink=segment_sink)
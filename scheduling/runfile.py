@@ -0,0 +1,95 @@
+# Binary run files: a workload and one result, read back memory-mapped
+import itertools
+import mmap
+import operator
+import struct
+import sys
+from array import array
+from collections import namedtuple
+
+from .model import NameTable, ScheduleResult, Workload, _int_column
+
+
+# Saved runs: a workload and one algorithm's result in a compact binary file
+# Layout: a fixed header, then little-endian int64 columns back to back (arrival, burst, priority,
+# completion, turnaround, waiting, name offsets, then the log's process, start and end columns),
+# then the UTF-8 name bytes. load_run memory-maps the file, so the columns are read from disk on
+# demand and multi-GB logs can be charted or summed without re-simulating or reading them into memory
+RUN_FILE_EXTENSION = ".schedrun"
+RUN_FILE_MAGIC = b"SCHEDRUN"
+RUN_FILE_VERSION = 1
+# magic, version, reserved, algorithm, processes, segments, size of the name bytes
+_RUN_HEADER = struct.Struct("<8sII16sqqq")
+
+# A run read back by load_run
+SavedRun = namedtuple("SavedRun", ["algorithm", "workload", "result"])
+
+
+def save_run(path, algorithm, workload, result):
+    names = result.names
+    if isinstance(names, NameTable):
+        name_data, name_offsets = names._data, names._offsets
+    else:
+        name_data, name_offsets = bytearray(), array("q", [0])
+        for name in names:
+            name_data += str(name).encode()
+            name_offsets.append(len(name_data))
+
+    columns = [workload.arrival_times, workload.burst_times, workload.priorities,
+               result.completion_times, result.turnaround_times, result.waiting_times, name_offsets,
+               result.log_process, result.log_start, result.log_end]
+    header = _RUN_HEADER.pack(RUN_FILE_MAGIC, RUN_FILE_VERSION, 0, algorithm.encode(), len(workload),
+                              len(result.log_process), len(name_data))
+
+    with open(path, "wb") as f:
+        f.write(header)
+        for column in columns:
+            column = _int_column(column)
+            if sys.byteorder != "little":
+                column = array("q", column)
+                column.byteswap()
+            f.write(column)
+        f.write(name_data)
+
+
+# Open a file written by save_run as a SavedRun whose columns are views of the memory-mapped file
+def load_run(path):
+    with open(path, "rb") as f:
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            raise ValueError(f"{path}: not a saved run") from None
+
+    if len(mapping) < _RUN_HEADER.size or mapping[:len(RUN_FILE_MAGIC)] != RUN_FILE_MAGIC:
+        raise ValueError(f"{path}: not a saved run")
+    _, version, _, algorithm, n, segments, names_size = _RUN_HEADER.unpack_from(mapping)
+    if version != RUN_FILE_VERSION:
+        raise ValueError(f"{path}: unsupported run file version {version}")
+    if len(mapping) != _RUN_HEADER.size + 8 * (7 * n + 1 + 3 * segments) + names_size:
+        raise ValueError(f"{path}: run file is truncated or corrupt")
+
+    view = memoryview(mapping)
+    offset = _RUN_HEADER.size
+
+    def column(length):
+        nonlocal offset
+        values = view[offset:offset + 8 * length].cast("q")
+        offset += 8 * length
+        if sys.byteorder != "little":  # No zero-copy view on a big-endian machine
+            values = array("q", values)
+            values.byteswap()
+        return values
+
+    arrival_times, burst_times, priorities = column(n), column(n), column(n)
+    completion_times, turnaround_times, waiting_times = column(n), column(n), column(n)
+    name_offsets = column(n + 1)
+    # Names are sliced out of the name bytes by these offsets, so they must run from 0 to the end of the bytes in order
+    if (name_offsets[0] != 0 or name_offsets[-1] != names_size
+            or not all(map(operator.le, name_offsets, itertools.islice(name_offsets, 1, None)))):
+        raise ValueError(f"{path}: run file is truncated or corrupt")
+    log_process, log_start, log_end = column(segments), column(segments), column(segments)
+    names = NameTable.from_buffers(view[offset:offset + names_size], name_offsets)
+
+    workload = Workload(names, burst_times, arrival_times, priorities)
+    result = ScheduleResult(names, completion_times, turnaround_times, waiting_times, log_process, log_start, log_end)
+    return SavedRun(algorithm.rstrip(b"\0").decode(), workload, result)
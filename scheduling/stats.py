@@ -0,0 +1,190 @@
+# Turnaround and waiting time statistics of schedule results
+import itertools
+import operator
+from array import array
+from collections import deque
+
+# NumPy is optional: extended_stats uses it when it is installed and falls back to builtins otherwise
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Running totals and averages of the turnaround and waiting times of a streamed run
+# Pass it as on_complete to one of the *_stream generators; it only keeps a few numbers
+class StatsAccumulator:
+    def __init__(self, workload):
+        self.arrival_times = workload.arrival_times
+        self.burst_times = workload.burst_times
+        self.completed = 0  # Number of processes completed so far
+        self.total_turnaround = 0
+        self.total_waiting = 0
+
+    def __call__(self, process, completion_time):
+        turnaround = completion_time - self.arrival_times[process]
+        self.completed += 1
+        self.total_turnaround += turnaround
+        self.total_waiting += turnaround - self.burst_times[process]
+
+    @property
+    def avg_turnaround(self):
+        return self.total_turnaround / self.completed if self.completed else 0.0
+
+    @property
+    def avg_waiting(self):
+        return self.total_waiting / self.completed if self.completed else 0.0
+
+    def stats(self):
+        # Same layout as calc_stats, averaged over the processes completed so far
+        return self.total_turnaround, self.avg_turnaround, self.total_waiting, self.avg_waiting
+
+
+# Totals and averages of the turnaround and waiting times of a result
+# Accepts a ScheduleResult or the list-based (completion, turnaround, waiting, execution_log) tuple
+def calc_stats(result, num_processes=None):
+    if num_processes is None:
+        num_processes = len(result[1])
+    total_turnaround = sum(result[1])
+    avg_turnaround = total_turnaround / num_processes
+    total_waiting = sum(result[2])
+    avg_waiting = total_waiting / num_processes
+
+    return total_turnaround, avg_turnaround, total_waiting, avg_waiting
+
+
+# Percentiles reported by extended_stats
+PERCENTILES = (50, 95, 99)
+
+
+# Counts extended_stats needs from the execution log, gathered segment by segment: the first dispatch of
+# each process, the number of context switches and the end of the last segment. Called as a
+# segment_sink(process, start, end) it collects them from a streamed run, so its log never has to be kept;
+# from_log fills it in from a kept log instead, with C-level iteration only
+class LogMetrics:
+    def __init__(self, processes):
+        self.first_start = array("q", [-1]) * processes  # First dispatch of each process, -1 for processes that never ran
+        self.context_switches = 0  # Segments of a different process than the segment before
+        self.last_process = None
+        self.last_end = None  # Latest end of a segment, None while there is none
+
+    def __call__(self, process, start, end):
+        if self.first_start[process] < 0:
+            self.first_start[process] = start
+        if process != self.last_process:
+            if self.last_process is not None:
+                self.context_switches += 1
+            self.last_process = process
+        if self.last_end is None or end > self.last_end:
+            self.last_end = end
+
+    @classmethod
+    def from_log(cls, processes, result):
+        metrics = cls(processes)
+        log_process, log_start = result.log_process, result.log_start
+        if not len(log_process):
+            return metrics
+        # Going backwards, earlier segments overwrite later ones, so each process is left with its first start
+        deque(map(metrics.first_start.__setitem__, reversed(log_process), reversed(log_start)), maxlen=0)
+        metrics.context_switches = sum(map(operator.ne, itertools.islice(log_process, 1, None), log_process))
+        metrics.last_process = log_process[-1]
+        metrics.last_end = max(result.log_end)
+        return metrics
+
+
+# Response times, percentiles, throughput, CPU utilization, idle time and context switches of a result
+# of workload, as a dict. Everything is computed column-wise over the result's arrays and execution log:
+# with NumPy as zero-copy views (memory-mapped runs included), otherwise with C-level builtins, so that
+# no Python code runs per segment either way. The log-derived counts can be given as log_metrics, a
+# LogMetrics that was the run's segment sink; the result's log is then not used and may be empty.
+# CPU busy time is the sum of the bursts, as SRT's log also covers the idle time before the next arrival
+def extended_stats(workload, result, log_metrics=None):
+    n = len(workload)
+    if np is not None:
+        return _extended_stats_numpy(workload, result, n, log_metrics)
+
+    if log_metrics is None:
+        log_metrics = LogMetrics.from_log(n, result)
+    first_start = log_metrics.first_start
+    arrival_times = workload.arrival_times
+
+    # Response times of the processes that ran, summed without building a list of them
+    ran = sum(map(operator.ge, first_start, itertools.repeat(0)))
+    total_response = (sum(itertools.compress(first_start, map(operator.ge, first_start, itertools.repeat(0))))
+                      - sum(itertools.compress(arrival_times, map(operator.ge, first_start, itertools.repeat(0)))))
+    return _extended_stats_dict(
+        n,
+        total_response / ran if ran else 0.0,
+        _percentiles(sorted(result.waiting_times)),
+        _percentiles(sorted(result.turnaround_times)),
+        sum(workload.burst_times),
+        (log_metrics.last_end - min(arrival_times)) if log_metrics.last_end is not None else 0,
+        log_metrics.context_switches,
+    )
+
+
+def _extended_stats_numpy(workload, result, n, log_metrics):
+    arrival_times = np.frombuffer(workload.arrival_times, dtype=np.int64)
+
+    if log_metrics is not None:
+        first_start = np.frombuffer(log_metrics.first_start, dtype=np.int64)
+        ran = first_start >= 0
+        response_times = first_start[ran] - arrival_times[ran]
+        last_end = log_metrics.last_end
+        context_switches = log_metrics.context_switches
+    else:
+        log_process = np.frombuffer(result.log_process, dtype=np.int64)
+        log_start = np.frombuffer(result.log_start, dtype=np.int64)
+        log_end = np.frombuffer(result.log_end, dtype=np.int64)
+
+        # First dispatch of each process: the lowest log position it appears at (len(log) for processes that never ran)
+        segments = len(log_process)
+        first = np.full(n, segments, dtype=np.int64)
+        np.minimum.at(first, log_process, np.arange(segments))
+        ran = first < segments
+        response_times = log_start[first[ran]] - arrival_times[ran]
+        last_end = int(log_end.max()) if segments else None
+        context_switches = int(np.count_nonzero(log_process[1:] != log_process[:-1]))
+
+    return _extended_stats_dict(
+        n,
+        float(response_times.mean()) if len(response_times) else 0.0,
+        _numpy_percentiles(result.waiting_times),
+        _numpy_percentiles(result.turnaround_times),
+        int(np.frombuffer(workload.burst_times, dtype=np.int64).sum()),
+        (last_end - int(arrival_times.min())) if last_end is not None else 0,
+        context_switches,
+    )
+
+
+def _extended_stats_dict(n, avg_response, waiting, turnaround, busy_time, span, context_switches):
+    stats = {"avg_response": avg_response}
+    for q, value in zip(PERCENTILES, waiting):
+        stats[f"p{q}_waiting"] = value
+    for q, value in zip(PERCENTILES, turnaround):
+        stats[f"p{q}_turnaround"] = value
+    stats["throughput"] = n / span if span else 0.0  # Processes per time unit, from the first arrival to the last completion
+    stats["cpu_utilization"] = busy_time / span if span else 0.0
+    stats["idle_time"] = max(span - busy_time, 0)
+    stats["context_switches"] = context_switches
+    return stats
+
+
+# Linear-interpolation percentiles of sorted values, the same as NumPy's default
+def _percentiles(values):
+    if not values:
+        return [0.0] * len(PERCENTILES)
+    percentiles = []
+    for q in PERCENTILES:
+        position = (len(values) - 1) * q / 100
+        low = int(position)
+        high = min(low + 1, len(values) - 1)
+        percentiles.append(values[low] + (values[high] - values[low]) * (position - low))
+    return percentiles
+
+
+def _numpy_percentiles(column):
+    values = np.frombuffer(column, dtype=np.int64) if not isinstance(column, list) else np.asarray(column, dtype=np.int64)
+    if not len(values):
+        return [0.0] * len(PERCENTILES)
+    return [float(value) for value in np.percentile(values, PERCENTILES)]
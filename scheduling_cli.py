@@ -0,0 +1,9 @@
+# The headless runner now lives in scheduling.cli (python -m scheduling <trace> ...)
+# This script keeps the old command line and imports working
+import sys
+
+from scheduling.cli import *  # noqa: F401,F403
+from scheduling.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
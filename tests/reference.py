@@ -0,0 +1,219 @@
+# The four schedulers as they were in SchedulingAlgoFinal.py before the scheduling package, kept
+# unchanged (tick by tick and O(n) per tick) as the reference the package's output is checked against
+
+# Function to simulate the Round Robin scheduling algorithm
+def round_robin(processes, burst_times, arrival_times, quantum):
+    n = len(processes)  # Number of processes
+    remaining_burst = burst_times[:]  # Copy of burst times to track remaining burst times
+    completion_times = [0] * n  # Completion times for each process
+    time = 0  # Current time in the simulation
+    queue = []  # Queue to manage the processes in round-robin order
+    in_queue = [False] * n  # Track whether a process is in the queue
+    execution_log = []  # Log to store the execution order and time intervals
+
+    while True:
+        done = True  # Flag to check if all processes are completed
+
+        # Add processes to the queue that have arrived and are not already in it
+        for i in range(n):
+            if arrival_times[i] <= time and not in_queue[i] and remaining_burst[i] > 0:
+                queue.append(i)
+                in_queue[i] = True
+
+        # If the queue is empty but some processes are not completed, increment time
+        if not queue and any(remaining_burst):
+            time += 1
+            continue
+
+        # Process the first process in the queue
+        if queue:
+            current = queue.pop(0)
+            done = False
+
+            # If the process needs more time than the quantum
+            if remaining_burst[current] > quantum:
+                execution_log.append((processes[current], time, time + quantum))  # Log execution
+                time += quantum
+                remaining_burst[current] -= quantum
+            else:  # Process completes within the quantum
+                execution_log.append((processes[current], time, time + remaining_burst[current]))
+                time += remaining_burst[current]
+                remaining_burst[current] = 0
+                completion_times[current] = time
+
+            # Add newly arrived processes to the queue
+            for i in range(n):
+                if arrival_times[i] <= time and remaining_burst[i] > 0 and not in_queue[i]:
+                    queue.append(i)
+                    in_queue[i] = True
+
+            # Re-add the current process to the queue if it is not completed
+            if remaining_burst[current] > 0:
+                queue.append(current)
+            else:
+                in_queue[current] = False
+
+        # Break the loop if all processes are completed
+        if done:
+            break
+
+    # Calculate turnaround times and waiting times
+    turnaround_times = [completion_times[i] - arrival_times[i] for i in range(n)]
+    waiting_times = [turnaround_times[i] - burst_times[i] for i in range(n)]
+
+    return completion_times, turnaround_times, waiting_times, execution_log
+
+
+# Function to simulate the SJN scheduling algorithm
+def sjn(processes, burst_times, arrival_times):
+    n = len(processes) # number of processes
+    remaining_burst = burst_times[:] # copy of burst time
+    turnaround_times = [0] * n  # Turnaround times for each process
+    waiting_times = [0] * n  # Waiting times for each process
+    completion_times = [0] * n  # Completion times for each process
+    time = 0  # Current time in the simulation
+    queue = []  # Queue to manage the processes in round-robin order
+    in_queue = [False] * n  # Track whether a process is in the queue
+    execution_log = []  # Log to store the execution order and time intervals
+
+    while True:
+        done = True # Flag to check if all processes are completed
+
+        # Add processes to the queue that have arrived and are not already in it
+        for i in range(n):
+            if arrival_times[i] <= time and not in_queue[i] and remaining_burst[i] > 0:
+                queue.append(i)
+                in_queue[i] = True
+
+        # If the queue is empty and there are still processes to complete, move the time forward
+        if not queue and any(remaining_burst):
+            time += 1
+            continue
+
+        # Process the first process in the queue
+        if queue:
+
+            # Sort queue based on remaining burst time (Shortest Job Next)
+            queue.sort(key=lambda x: remaining_burst[x])
+            current = queue.pop(0)  # Get the process with the shortest burst time
+            done = False
+
+            # Process the selected process
+            remaining_burst[current] = 0  # Mark the burst time as completed
+            completion_times[current] = time + burst_times[current]  # Set completion time
+            turnaround_times[current] = completion_times[current] - arrival_times[current]  # Calculate turnaround time
+            waiting_times[current] = turnaround_times[current] - burst_times[current]  # Calculate waiting time
+
+            # Add the execution log with the process name and the time interval it was executed
+            execution_log.append((processes[current], time, time + burst_times[current]))
+            
+            # update the current time
+            time += burst_times[current]
+
+        if done:
+            break
+
+    return completion_times, turnaround_times, waiting_times, execution_log
+
+# Function to simulate the SRT scheduling algorithm
+def srt(processes, burst_times, arrival_times):
+    n = len(processes)  # Number of processes
+    remaining_burst = burst_times[:]  # Copy of burst times to track remaining burst time
+    turnaround_times = [0] * n  # Turnaround times for each process
+    waiting_times = [0] * n  # Waiting times for each process
+    completion_times = [0] * n  # Completion times for each process
+    time = 0  # Current time in the simulation
+    in_queue = [False] * n  # Track whether a process has arrived
+    execution_log = []  # Log to store the execution order and time intervals
+
+    last_process = None  # To track the last executed process
+    last_process_start_time = 0  # To track the time when the current process started
+
+    while True:
+        done = True  # Flag to check if all processes are completed
+
+        # Add processes to the queue that have arrived and are not already in the queue
+        for i in range(n):
+            if arrival_times[i] <= time and not in_queue[i] and remaining_burst[i] > 0:
+                in_queue[i] = True
+                done = False  # Mark that not all processes are done
+
+        # If there are no remaining processes to execute and no processes are incomplete, break the loop
+        if done and all(b == 0 for b in remaining_burst):
+            break
+
+        # Find the process with the shortest remaining burst time
+        available_processes = [(i, remaining_burst[i]) for i in range(n) if in_queue[i] and remaining_burst[i] > 0]
+        if available_processes:
+            # Sort the processes by remaining burst time
+            available_processes.sort(key=lambda x: x[1])
+            current = available_processes[0][0]  # Get the process with the shortest remaining burst time
+
+            # If the process has changed, log the previous process execution
+            if last_process is None or current != last_process:
+                if last_process is not None:
+                    execution_log.append((processes[last_process], last_process_start_time, time))  # Log previous process
+                last_process_start_time = time  # Set the start time of the new process
+
+            # Execute the process for 1 time unit
+            remaining_burst[current] -= 1  # Decrease remaining burst time
+            time += 1  # Update the current time
+
+            # If the process is completed, calculate completion time, turnaround time, and waiting time
+            if remaining_burst[current] == 0:
+                completion_times[current] = time  # Set completion time
+                turnaround_times[current] = completion_times[current] - arrival_times[current]  # Calculate turnaround time
+                waiting_times[current] = turnaround_times[current] - burst_times[current]  # Calculate waiting time
+
+            # Update last_process to the current process
+            last_process = current
+        else:
+            # If no processes are ready to execute, increment the time
+            time += 1
+
+    # After the loop, log the last process
+    if last_process is not None:
+        execution_log.append((processes[last_process], last_process_start_time, time))
+
+    return completion_times, turnaround_times, waiting_times, execution_log
+
+# Non-Preemptive Priority Scheduling Function
+def non_preemptive_priority(processes, burst_times, arrival_times, priorities):
+
+    n = len(processes)  # Number of processes
+    remaining_burst = burst_times[:]  # Copy of burst times to track remaining burst time
+    turnaround_times = [0] * n  # Turnaround times for each process
+    waiting_times = [0] * n  # Waiting times for each process
+    completion_times = [0] * n  # Completion times for each process
+    time = 0  # Current time in the simulation
+    completed = 0
+    execution_log = []  # Log to store the execution order and time intervals
+    is_completed = [False] * n
+
+    while completed < n:
+        # Find the highest priority process that has arrived
+        idx = -1
+        for i in range(n):
+            if arrival_times[i] <= time and not is_completed[i]:
+                if idx == -1 or priorities[i] < priorities[idx]:
+                    idx = i
+
+        if idx != -1:
+            # Process the selected process
+            process = processes[idx]
+            start_time = max(time, arrival_times[idx])
+            finish_time = start_time + remaining_burst[idx]
+
+            completion_times[idx] = finish_time
+            turnaround_times[idx] = completion_times[idx] - arrival_times[idx]
+            waiting_times[idx] = turnaround_times[idx] - burst_times[idx]
+
+            execution_log.append((process, start_time, finish_time))
+
+            time = finish_time
+            is_completed[idx] = True
+            completed += 1
+        else:
+            time += 1
+
+    return completion_times, turnaround_times, waiting_times, execution_log
@@ -0,0 +1,157 @@
+import random
+import unittest
+from unittest import mock
+
+from scheduling import (ALGORITHMS, Instrumentation, Workload, non_preemptive_priority, rerun_algorithm, round_robin,
+                        round_robin_sweep, run_algorithm, sjn, srt)
+
+from . import reference
+
+
+# Random process trace of up to max_processes processes, as the lists the schedulers take;
+# about one in five traces has processes with no burst time
+def random_trace(rng, max_processes, max_arrival):
+    n = rng.randint(1, max_processes)
+    empty = rng.random() < 0.2
+    burst_times = [rng.randint(0 if empty else 1, rng.choice([3, 10, 25])) for _ in range(n)]
+    arrival_times = [rng.randint(0, rng.choice([0, 5, max_arrival])) for _ in range(n)]
+    priorities = [rng.randint(0, 4) for _ in range(n)]
+    return [f"P{i}" for i in range(n)], burst_times, arrival_times, priorities
+
+
+# random_trace as a Workload
+def random_workload(rng, max_processes, max_arrival):
+    return Workload(*random_trace(rng, max_processes, max_arrival))
+
+
+# The columns of a ScheduleResult, as lists to compare
+def columns(result):
+    return (list(result.completion_times), list(result.turnaround_times), list(result.waiting_times),
+            list(result.log_process), list(result.log_start), list(result.log_end))
+
+
+# The schedulers give the same completion, turnaround and waiting times and execution log
+# as the original tick-by-tick implementations, quirks included
+class ReferenceTest(unittest.TestCase):
+    def assert_same(self, expected, actual, case):
+        self.assertEqual(tuple(list(column) for column in expected), tuple(list(column) for column in actual), case)
+
+    def test_round_robin(self):
+        rng = random.Random(1)
+        for case in range(2000):
+            processes, burst_times, arrival_times, _ = random_trace(rng, 9, rng.choice([30, 80]))
+            quantum = rng.randint(1, 6)
+            self.assert_same(reference.round_robin(processes, burst_times, arrival_times, quantum),
+                             round_robin(processes, burst_times, arrival_times, quantum), case)
+
+    def test_sjn(self):
+        rng = random.Random(2)
+        for case in range(2000):
+            processes, burst_times, arrival_times, _ = random_trace(rng, 9, rng.choice([30, 80]))
+            self.assert_same(reference.sjn(processes, burst_times, arrival_times), sjn(processes, burst_times, arrival_times), case)
+
+    def test_srt(self):
+        rng = random.Random(3)
+        for case in range(2000):
+            processes, burst_times, arrival_times, _ = random_trace(rng, 9, rng.choice([30, 80]))
+            self.assert_same(reference.srt(processes, burst_times, arrival_times), srt(processes, burst_times, arrival_times), case)
+
+    def test_non_preemptive_priority(self):
+        rng = random.Random(4)
+        for case in range(2000):
+            processes, burst_times, arrival_times, priorities = random_trace(rng, 9, rng.choice([30, 80]))
+            self.assert_same(reference.non_preemptive_priority(processes, burst_times, arrival_times, priorities),
+                             non_preemptive_priority(processes, burst_times, arrival_times, priorities), case)
+
+    # Called with a Workload, the schedulers give a ScheduleResult with the same columns
+    def test_workload_form(self):
+        rng = random.Random(5)
+        for case in range(500):
+            processes, burst_times, arrival_times, priorities = random_trace(rng, 9, rng.choice([30, 80]))
+            workload = Workload(processes, burst_times, arrival_times, priorities)
+            quantum = rng.randint(1, 6)
+            self.assert_same(reference.round_robin(processes, burst_times, arrival_times, quantum), round_robin(workload, quantum).as_tuple(), case)
+            self.assert_same(reference.sjn(processes, burst_times, arrival_times), sjn(workload).as_tuple(), case)
+            self.assert_same(reference.srt(processes, burst_times, arrival_times), srt(workload).as_tuple(), case)
+            self.assert_same(reference.non_preemptive_priority(processes, burst_times, arrival_times, priorities),
+                             non_preemptive_priority(workload).as_tuple(), case)
+
+    def test_all_empty(self):
+        processes, burst_times, arrival_times, priorities = ["A", "B", "C"], [0, 0, 0], [2, 0, 1], [1, 0, 2]
+        self.assert_same(reference.round_robin(processes, burst_times, arrival_times, 2), round_robin(processes, burst_times, arrival_times, 2), "rr")
+        self.assert_same(reference.sjn(processes, burst_times, arrival_times), sjn(processes, burst_times, arrival_times), "sjn")
+        self.assert_same(reference.srt(processes, burst_times, arrival_times), srt(processes, burst_times, arrival_times), "srt")
+        self.assert_same(reference.non_preemptive_priority(processes, burst_times, arrival_times, priorities),
+                         non_preemptive_priority(processes, burst_times, arrival_times, priorities), "priority")
+
+
+# A what-if re-run from checkpoints gives the same result as running the edited workload from scratch
+# CHECKPOINT_INTERVAL is patched to 1 so there is a checkpoint at nearly every event to resume from
+class RerunTest(unittest.TestCase):
+    @mock.patch("scheduling.engine.CHECKPOINT_INTERVAL", 1)
+    def test_rerun_matches_run(self):
+        rng = random.Random(5)
+        resumed = 0
+        for case in range(300):
+            workload = random_workload(rng, 40, 300)
+            n = len(workload)
+            quantum = rng.randint(1, 5)
+            for algorithm in ALGORITHMS:
+                previous_workload = workload
+                previous, _ = run_algorithm(algorithm, workload, quantum, checkpoints=True)
+                # A few edits in a row, each re-run from the result of the one before
+                for edit in range(3):
+                    burst_times = list(previous_workload.burst_times)
+                    arrival_times = list(previous_workload.arrival_times)
+                    priorities = list(previous_workload.priorities)
+                    for _ in range(rng.randint(1, 2)):
+                        i = rng.randrange(n)
+                        column = rng.choice([burst_times, arrival_times, priorities])
+                        column[i] = rng.randint(0, 15 if column is burst_times else 300 if column is arrival_times else 4)
+                    edited = Workload(list(workload.names), burst_times, arrival_times, priorities)
+
+                    result, result_stats = rerun_algorithm(algorithm, previous_workload, previous, edited, quantum=quantum)
+                    expected, expected_stats = run_algorithm(algorithm, edited, quantum)
+                    self.assertEqual(columns(result), columns(expected), (case, algorithm, edit))
+                    self.assertEqual(result_stats, expected_stats, (case, algorithm, edit))
+                    if previous.checkpoints and result.checkpoints:
+                        resumed += 1
+                    previous_workload, previous = edited, result
+        # The re-runs must actually have resumed from checkpoints, not just run again from the start
+        self.assertGreater(resumed, 0)
+
+
+
+# A Round Robin quantum below 1 never advances the clock; it is refused before anything runs
+class QuantumTest(unittest.TestCase):
+    def test_rejects_quantum_below_one(self):
+        workload = Workload(["A", "B"], [3, 2], [0, 1])
+        for quantum in (0, -2):
+            with self.assertRaises(ValueError):
+                run_algorithm("rr", workload, quantum)
+            with self.assertRaises(ValueError):
+                round_robin_sweep(workload, [2, quantum])
+            with self.assertRaises(ValueError):
+                round_robin_sweep(workload, [2, quantum], workers=2)
+        self.assertEqual([row.quantum for row in round_robin_sweep(workload, [1, 2])], [1, 2])
+
+
+# An instrument used for several runs reports each run on its own, the same as a fresh one
+class InstrumentationTest(unittest.TestCase):
+    def test_reused_instrument(self):
+        rng = random.Random(6)
+        instrument = Instrumentation()
+        for case in range(200):
+            workload = random_workload(rng, 12, 80)
+            quantum = rng.randint(1, 6)
+            for algorithm in ALGORITHMS:
+                fresh = Instrumentation()
+                run_algorithm(algorithm, workload, quantum, instrument=fresh)
+                run_algorithm(algorithm, workload, quantum, instrument=instrument)
+                expected, report = fresh.report(), instrument.report()
+                del expected["wall_time"], report["wall_time"]
+                self.assertEqual(report, expected, (case, algorithm))
+
+
+if __name__ == "__main__":
+    unittest.main()
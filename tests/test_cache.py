@@ -0,0 +1,79 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from scheduling import ALGORITHMS, ResultCache, Workload
+
+from .test_algorithms import columns
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.workload = Workload(["A", "B", "C"], [4, 2, 3], [0, 1, 1], [2, 0, 1])
+
+    def test_quantum_only_counts_for_round_robin(self):
+        for algorithm in ALGORITHMS:
+            cache = ResultCache()
+            cache.run(algorithm, self.workload, 2)
+            cache.run(algorithm, self.workload, 3)
+            self.assertEqual(cache.misses, 2 if algorithm == "rr" else 1, algorithm)
+            self.assertEqual(cache.hits, 0 if algorithm == "rr" else 1, algorithm)
+
+    def test_priorities_only_count_for_priority(self):
+        reprioritized = Workload(self.workload.names, self.workload.burst_times, self.workload.arrival_times, [0, 1, 2])
+        for algorithm in ALGORITHMS:
+            cache = ResultCache()
+            cache.run(algorithm, self.workload, 2)
+            result, _ = cache.run(algorithm, reprioritized, 2)
+            self.assertEqual(cache.misses, 2 if algorithm == "priority" else 1, algorithm)
+            if algorithm == "priority":
+                self.assertEqual(columns(result), columns(ResultCache().run(algorithm, reprioritized)[0]))
+
+    def test_cache_version(self):
+        key = ResultCache.key("srt", self.workload)
+        with mock.patch("scheduling.cache.CACHE_VERSION", 2):
+            self.assertNotEqual(ResultCache.key("srt", self.workload), key)
+        self.assertEqual(ResultCache.key("srt", self.workload), key)
+
+    def test_cache_version_on_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ResultCache(directory=directory).run("srt", self.workload)
+            with mock.patch("scheduling.cache.CACHE_VERSION", 2):
+                cache = ResultCache(directory=directory)
+                cache.run("srt", self.workload)
+                self.assertEqual((cache.disk_hits, cache.misses), (0, 1))
+
+    def test_lru_eviction(self):
+        cache = ResultCache(maxsize=2)
+        workloads = [Workload(["A"], [burst], [0]) for burst in (1, 2, 3)]
+        keys = [cache.key("sjn", workload) for workload in workloads]
+        cache.run("sjn", workloads[0])
+        cache.run("sjn", workloads[1])
+        # Using the first makes the second the least recently used, so the third evicts it
+        cache.run("sjn", workloads[0])
+        cache.run("sjn", workloads[2])
+        self.assertEqual(list(cache.entries), [keys[0], keys[2]])
+        cache.run("sjn", workloads[1])
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+        self.assertEqual(cache.info()["size"], 2)
+
+    def test_disk_reload(self):
+        with tempfile.TemporaryDirectory() as directory:
+            first = ResultCache(directory=directory)
+            expected, expected_stats = first.run("rr", self.workload, 2)
+            # A new cache, as in a later process, finds the result on disk, then keeps it in memory
+            cache = ResultCache(directory=directory)
+            result, result_stats = cache.run("rr", self.workload, 2)
+            self.assertEqual((cache.hits, cache.disk_hits, cache.misses), (0, 1, 0))
+            self.assertEqual(columns(result), columns(expected))
+            self.assertEqual(result_stats, expected_stats)
+            cache.run("rr", self.workload, 2)
+            self.assertEqual((cache.hits, cache.disk_hits, cache.misses), (1, 1, 0))
+            # After clear() only the directory has it
+            cache.clear()
+            cache.run("rr", self.workload, 2)
+            self.assertEqual((cache.hits, cache.disk_hits, cache.misses), (1, 2, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
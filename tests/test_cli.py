@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import unittest
+
+from scheduling.cli import read_trace
+
+
+class ReadTraceTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, filename, text):
+        path = os.path.join(self.directory, filename)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        return path
+
+    def assert_workload(self, workload, names, burst_times, arrival_times, priorities):
+        self.assertEqual(list(workload.names), names)
+        self.assertEqual(list(workload.burst_times), burst_times)
+        self.assertEqual(list(workload.arrival_times), arrival_times)
+        self.assertEqual(list(workload.priorities), priorities)
+
+    def test_csv(self):
+        path = self.write("trace.csv", "name,arrival,burst,priority\nA,0,5,2\nB,3,2,1\n\nC,4,1,0\n")
+        self.assert_workload(read_trace(path), ["A", "B", "C"], [5, 2, 1], [0, 3, 4], [2, 1, 0])
+
+    def test_csv_aliases(self):
+        # Other column names and order, no priority column, and a row without a name
+        path = self.write("trace.csv", "Burst_Time, Process ,Arrival_Time\n5,A,0\n2,,3\r\n")
+        self.assert_workload(read_trace(path), ["A", "P1"], [5, 2], [0, 3], [0, 0])
+
+    def test_jsonl(self):
+        lines = [{"process": "A", "arrival_time": 0, "burst_time": 5, "priority": 2},
+                 {"process": "B", "arrival_time": 3, "burst_time": 2},
+                 {"arrival_time": "4", "burst_time": "1"}]
+        text = "\n".join(json.dumps(line) for line in lines[:2]) + "\n\n" + json.dumps(lines[2]) + "\n"
+        self.assert_workload(read_trace(self.write("trace.jsonl", text)), ["A", "B", "P2"], [5, 2, 1], [0, 3, 4], [2, 0, 0])
+        # The format can also be given, whatever the extension
+        self.assert_workload(read_trace(self.write("trace.txt", text), "jsonl"), ["A", "B", "P2"], [5, 2, 1], [0, 3, 4], [2, 0, 0])
+
+    def test_chunk_boundaries(self):
+        rows = [(f"P{i}" if i % 3 else "", i * 2, i % 5 + 1, i % 4) for i in range(11)]
+        csv_path = self.write("trace.csv", "name,arrival,burst,priority\n" + "".join(f"{n},{a},{b},{p}\n" for n, a, b, p in rows))
+        jsonl_path = self.write("trace.jsonl", "".join(json.dumps({"name": n, "arrival": a, "burst": b, "priority": p}) + "\n"
+                                                       for n, a, b, p in rows))
+        names = [f"P{i}" for i in range(11)]
+        burst_times = [b for _, _, b, _ in rows]
+        arrival_times = [a for _, a, _, _ in rows]
+        priorities = [p for _, _, _, p in rows]
+        for path in (csv_path, jsonl_path):
+            for chunk_rows in (1, 2, 3, 10, 11, 12):
+                self.assert_workload(read_trace(path, chunk_rows=chunk_rows), names, burst_times, arrival_times, priorities)
+
+    def test_bad_number(self):
+        path = self.write("trace.csv", "name,arrival,burst\nA,0,5\nB,1,x\nC,2,3\n")
+        with self.assertRaisesRegex(ValueError, "invalid number in rows 1-3"):
+            read_trace(path)
+        with self.assertRaisesRegex(ValueError, "invalid number in rows 2-2"):
+            read_trace(path, chunk_rows=1)
+
+    def test_bad_json(self):
+        path = self.write("trace.jsonl", '{"arrival": 0, "burst": 5}\n\n{"arrival": 1, "burst": \n')
+        with self.assertRaisesRegex(ValueError, "line 3: invalid JSON"):
+            read_trace(path)
+        path = self.write("trace.jsonl", '{"arrival": 0, "burst": 5}\n[1, 2]\n')
+        with self.assertRaisesRegex(ValueError, "line 2: not a JSON object"):
+            read_trace(path)
+        path = self.write("trace.jsonl", '{"arrival": 0, "burst": null}\n')
+        with self.assertRaisesRegex(ValueError, "invalid number in rows 1-1"):
+            read_trace(path)
+
+    def test_missing_column(self):
+        path = self.write("trace.csv", "name,arrival\nA,0\n")
+        with self.assertRaisesRegex(ValueError, "missing 'burst' column"):
+            read_trace(path)
+
+    def test_empty(self):
+        for text in ("", "name,arrival,burst\n"):
+            path = self.write("trace.csv", text)
+            with self.assertRaisesRegex(ValueError, "no processes"):
+                read_trace(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
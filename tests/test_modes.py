@@ -0,0 +1,97 @@
+import random
+import unittest
+
+from scheduling import ALGORITHMS, OnlineScheduler, Workload, multicore_schedule, run_algorithm
+
+from .test_algorithms import columns, random_workload
+
+
+# The online schedulers and multi-core runs drive the same policies as the batch runs,
+# so with every job submitted up front, or on one core, they give the batch result
+class OnlineTest(unittest.TestCase):
+    def test_matches_batch(self):
+        rng = random.Random(5)
+        for case in range(1000):
+            workload = random_workload(rng, 9, 80)
+            # Jobs are submitted in process order, so they have to arrive in that order
+            workload = Workload(workload.names, workload.burst_times, sorted(workload.arrival_times), workload.priorities)
+            n = len(workload)
+            quantum = rng.randint(1, 6)
+            # Advance the clock between submissions in two of three cases, up to a random time before each arrival
+            mode = case % 3
+            for algorithm in ALGORITHMS:
+                expected, _ = run_algorithm(algorithm, workload, quantum)
+                scheduler = OnlineScheduler(algorithm, quantum)
+                for i in range(n):
+                    arrival_time = workload.arrival_times[i]
+                    if mode:
+                        scheduler.advance(rng.randint(scheduler.clock, arrival_time))
+                    scheduler.submit(workload.names[i], workload.burst_times[i], arrival_time, workload.priorities[i])
+                    if mode == 2 and rng.random() < 0.5:
+                        scheduler.advance(arrival_time)
+                scheduler.advance()
+                # Jobs with no burst time included
+                self.assertEqual(columns(scheduler.result()), columns(expected), (case, algorithm))
+
+    def test_late_arrival_preempts(self):
+        scheduler = OnlineScheduler("srt")
+        scheduler.submit("a", 10)
+        scheduler.advance(3)
+        scheduler.submit("b", 2)
+        scheduler.advance()
+        self.assertEqual(scheduler.result().execution_log, [("a", 0, 3), ("b", 3, 5), ("a", 5, 12)])
+        with self.assertRaises(ValueError):
+            scheduler.submit("c", 1, 0)
+
+
+class MulticoreTest(unittest.TestCase):
+    def test_one_core_matches_batch(self):
+        rng = random.Random(7)
+        for case in range(1000):
+            workload = random_workload(rng, 12, 80)
+            quantum = rng.randint(1, 6)
+            for algorithm in ALGORITHMS:
+                expected, _ = run_algorithm(algorithm, workload, quantum)
+                for queues in ("global", "per-core"):
+                    result = multicore_schedule(workload, algorithm, 1, quantum, queues)
+                    if algorithm == "srt":
+                        # The single-CPU SRT log stretches a segment over the idle time after it; the cores' logs do not
+                        self.assertEqual(columns(result)[:3], columns(expected)[:3], (case, algorithm, queues))
+                    else:
+                        self.assertEqual(columns(result), columns(expected), (case, algorithm, queues))
+
+    def test_several_cores(self):
+        rng = random.Random(7)
+        for case in range(500):
+            workload = random_workload(rng, 12, 80)
+            n = len(workload)
+            quantum = rng.randint(1, 6)
+            cores = rng.randint(2, 4)
+            for algorithm in ALGORITHMS:
+                for queues in ("global", "per-core"):
+                    result = multicore_schedule(workload, algorithm, cores, quantum, queues)
+                    # A core runs one job at a time
+                    for core_process, core_start, core_end in result.core_logs:
+                        for end, start in zip(core_end, core_start[1:]):
+                            self.assertLessEqual(end, start, (case, algorithm, queues))
+                    # Every job runs for its whole burst, after it arrives, on one core at a time, and completes at its last segment
+                    segments = sorted(zip(result.log_process, result.log_start, result.log_end))
+                    for i in range(n):
+                        runs = [(start, end) for process, start, end in segments if process == i]
+                        self.assertEqual(sum(end - start for start, end in runs), workload.burst_times[i], (case, algorithm, queues))
+                        self.assertTrue(all(start >= workload.arrival_times[i] for start, _ in runs), (case, algorithm, queues))
+                        for (_, end), (start, _) in zip(runs, runs[1:]):
+                            self.assertLessEqual(end, start, (case, algorithm, queues))
+                        if workload.burst_times[i] > 0:
+                            self.assertEqual(result.completion_times[i], runs[-1][1], (case, algorithm, queues))
+
+    def test_srt_runs_shortest_jobs(self):
+        # Two cores busy with long jobs; a short arrival takes over the core of the one with the most time left
+        workload = Workload(["a", "b", "c"], [10, 20, 2], [0, 0, 5])
+        result = multicore_schedule(workload, "srt", 2, queues="global")
+        self.assertEqual(result.core_log(0), [("a", 0, 10)])
+        self.assertEqual(result.core_log(1), [("b", 0, 5), ("c", 5, 7), ("b", 7, 22)])
+
+
+if __name__ == "__main__":
+    unittest.main()
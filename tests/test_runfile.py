@@ -0,0 +1,95 @@
+import os
+import random
+import struct
+import tempfile
+import unittest
+
+from scheduling import ALGORITHMS, RUN_FILE_EXTENSION, Workload, load_run, run_algorithm, save_run
+from scheduling.runfile import _RUN_HEADER
+
+from .test_algorithms import columns, random_workload
+
+
+class RunFileTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "run" + RUN_FILE_EXTENSION)
+
+    # A saved run written for a small workload, as bytes to corrupt
+    def saved_bytes(self):
+        workload = Workload(["A", "B", "C"], [3, 1, 2], [0, 1, 2], [2, 0, 1])
+        result, _ = run_algorithm("sjn", workload)
+        save_run(self.path, "sjn", workload, result)
+        with open(self.path, "rb") as f:
+            return bytearray(f.read())
+
+    def write(self, data):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def test_round_trip(self):
+        rng = random.Random(13)
+        for case in range(100):
+            workload = random_workload(rng, 20, 80)
+            if case % 2:
+                # Names that are not ASCII, and an empty one
+                workload = Workload(["é", "", *(f"进程{i}" for i in range(1, len(workload)))][:len(workload)],
+                                    workload.burst_times, workload.arrival_times, workload.priorities)
+            quantum = rng.randint(1, 6)
+            for algorithm in ALGORITHMS:
+                result, _ = run_algorithm(algorithm, workload, quantum)
+                save_run(self.path, algorithm, workload, result)
+                saved = load_run(self.path)
+                self.assertEqual(saved.algorithm, algorithm)
+                self.assertEqual(list(saved.workload.names), list(workload.names), (case, algorithm))
+                for column in ("burst_times", "arrival_times", "priorities"):
+                    self.assertEqual(list(getattr(saved.workload, column)), list(getattr(workload, column)), (case, algorithm))
+                self.assertEqual(columns(saved.result), columns(result), (case, algorithm))
+                self.assertEqual(saved.result.execution_log, result.execution_log, (case, algorithm))
+                # A loaded run saves again as the same file
+                with open(self.path, "rb") as f:
+                    data = f.read()
+                save_run(self.path + "2", algorithm, saved.workload, saved.result)
+                with open(self.path + "2", "rb") as f:
+                    self.assertEqual(f.read(), data, (case, algorithm))
+
+    def test_truncated(self):
+        data = self.saved_bytes()
+        for size in (0, 4, _RUN_HEADER.size, len(data) - 1):
+            self.write(data[:size])
+            with self.assertRaises(ValueError):
+                load_run(self.path)
+        self.write(data + b"\0")
+        with self.assertRaises(ValueError):
+            load_run(self.path)
+
+    def test_wrong_magic(self):
+        data = self.saved_bytes()
+        data[:8] = b"NOTARUN!"
+        self.write(data)
+        with self.assertRaisesRegex(ValueError, "not a saved run"):
+            load_run(self.path)
+
+    def test_wrong_version(self):
+        data = self.saved_bytes()
+        struct.pack_into("<I", data, 8, 99)
+        self.write(data)
+        with self.assertRaisesRegex(ValueError, "version 99"):
+            load_run(self.path)
+
+    def test_bad_name_offsets(self):
+        data = self.saved_bytes()
+        # The name offsets follow the six workload and result columns of the three processes
+        offsets = _RUN_HEADER.size + 8 * 6 * 3
+        self.assertEqual(struct.unpack_from("<4q", data, offsets), (0, 1, 2, 3))
+        for bad in ((1, 1, 2, 3), (0, 2, 1, 3), (0, 1, 2, 2), (0, 1, 2, 4), (0, -1, 2, 3)):
+            corrupt = bytearray(data)
+            struct.pack_into("<4q", corrupt, offsets, *bad)
+            self.write(corrupt)
+            with self.assertRaises(ValueError, msg=bad):
+                load_run(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
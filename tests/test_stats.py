@@ -0,0 +1,68 @@
+import random
+import unittest
+from unittest import mock
+
+from scheduling import ALGORITHMS, LogMetrics, Workload, extended_stats, run_algorithm, stats
+
+from .test_algorithms import random_workload
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# The extended metrics are the same whether the log counts come from a LogMetrics that was the run's
+# segment sink, from LogMetrics.from_log over the kept log, or from extended_stats reading the log itself
+class ExtendedStatsTest(unittest.TestCase):
+    def test_sink_matches_log(self):
+        rng = random.Random(11)
+        for case in range(500):
+            workload = random_workload(rng, 12, 80)
+            n = len(workload)
+            quantum = rng.randint(1, 6)
+            for algorithm in ALGORITHMS:
+                result, _ = run_algorithm(algorithm, workload, quantum)
+                sink = LogMetrics(n)
+                streamed, _ = run_algorithm(algorithm, workload, quantum, segment_sink=sink)
+                self.assertEqual(len(streamed.log_process), 0)
+                from_log = LogMetrics.from_log(n, result)
+                self.assertEqual(list(sink.first_start), list(from_log.first_start), (case, algorithm))
+                self.assertEqual(sink.context_switches, from_log.context_switches, (case, algorithm))
+                self.assertEqual(sink.last_end, from_log.last_end, (case, algorithm))
+
+                expected = extended_stats(workload, result)
+                self.assertEqual(extended_stats(workload, streamed, sink), expected, (case, algorithm))
+                self.assertEqual(extended_stats(workload, result, from_log), expected, (case, algorithm))
+
+    def test_values(self):
+        # The second process arrives while the first runs; the third after an idle gap
+        workload = Workload(["A", "B", "C"], [4, 2, 1], [0, 1, 10])
+        result, _ = run_algorithm("sjn", workload)
+        metrics = extended_stats(workload, result)
+        self.assertEqual(metrics["avg_response"], (0 + 3 + 0) / 3)
+        self.assertEqual(metrics["p50_waiting"], 0)
+        self.assertEqual(metrics["p50_turnaround"], 4)
+        self.assertEqual(metrics["context_switches"], 2)
+        self.assertEqual(metrics["idle_time"], 4)
+        self.assertEqual(metrics["cpu_utilization"], 7 / 11)
+        self.assertEqual(metrics["throughput"], 3 / 11)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_matches_builtins(self):
+        rng = random.Random(12)
+        for case in range(300):
+            workload = random_workload(rng, 30, 200)
+            quantum = rng.randint(1, 6)
+            for algorithm in ALGORITHMS:
+                result, _ = run_algorithm(algorithm, workload, quantum)
+                with_numpy = extended_stats(workload, result)
+                with mock.patch.object(stats, "np", None):
+                    without_numpy = extended_stats(workload, result)
+                self.assertEqual(with_numpy.keys(), without_numpy.keys())
+                for key, value in with_numpy.items():
+                    self.assertAlmostEqual(value, without_numpy[key], msg=(case, algorithm, key))
+
+
+if __name__ == "__main__":
+    unittest.main()